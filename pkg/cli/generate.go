@@ -1,10 +1,12 @@
 package cli
 
 import (
+	"bufio"
 	"context"
 	"encoding/json"
 	"fmt"
 	"os"
+	"path/filepath"
 
 	"github.com/ka1ne/template-doc-gen/pkg/html"
 	"github.com/ka1ne/template-doc-gen/pkg/schema"
@@ -17,6 +19,7 @@ var (
 	generateSourceDir   string
 	generateOutputDir   string
 	generateFormat      string
+	generateArchive     string
 	generateConcurrency int
 )
 
@@ -36,6 +39,7 @@ func newGenerateCommand() *cobra.Command {
 	cmd.Flags().StringVarP(&generateSourceDir, "source", "s", cfg.SourceDir, "Source directory containing templates")
 	cmd.Flags().StringVarP(&generateOutputDir, "output", "o", cfg.OutputDir, "Output directory for documentation")
 	cmd.Flags().StringVarP(&generateFormat, "format", "f", cfg.OutputFormat, "Output format (html, json, markdown)")
+	cmd.Flags().StringVarP(&generateArchive, "archive", "a", cfg.OutputArchive, "Write HTML documentation to a single zip archive instead of individual files")
 	cmd.Flags().IntVarP(&generateConcurrency, "concurrency", "c", cfg.Concurrency, "Number of concurrent workers")
 
 	return cmd
@@ -47,6 +51,7 @@ func runGenerate(ctx context.Context) error {
 	cfg.SourceDir = generateSourceDir
 	cfg.OutputDir = generateOutputDir
 	cfg.OutputFormat = generateFormat
+	cfg.OutputArchive = generateArchive
 	cfg.Concurrency = generateConcurrency
 
 	// Validate configuration
@@ -54,8 +59,13 @@ func runGenerate(ctx context.Context) error {
 		return fmt.Errorf("invalid configuration: %w", err)
 	}
 
-	// Create output directory if it doesn't exist
-	if err := os.MkdirAll(cfg.OutputDir, 0755); err != nil {
+	// Create the output directory, or only the archive's parent directory
+	// when everything goes into a single archive
+	outputDir := cfg.OutputDir
+	if cfg.OutputArchive != "" {
+		outputDir = filepath.Dir(cfg.OutputArchive)
+	}
+	if err := os.MkdirAll(outputDir, 0755); err != nil {
 		return fmt.Errorf("failed to create output directory: %w", err)
 	}
 
@@ -65,45 +75,87 @@ func runGenerate(ctx context.Context) error {
 	// Create template processor with schema manager
 	processor := template.NewProcessor(cfg.Logger)
 	processor.SetSchemaManager(schemaManager)
+	processor.SetConcurrency(cfg.Concurrency)
+	setValidationCache(processor)
 
 	// Process all templates
 	cfg.Logger.Info("Processing templates from ", cfg.SourceDir)
-	metadata, err := processor.ProcessAllTemplates(
-		cfg.SourceDir,
-		cfg.OutputDir,
-		cfg.OutputFormat,
-		false, // Not validate-only mode
-	)
-	if err != nil {
-		return fmt.Errorf("error processing templates: %w", err)
-	}
+	var metadata []*template.TemplateMetadata
+	var err error
+	if cfg.OutputFormat == "html" && cfg.OutputArchive != "" {
+		metadata, err = processor.ProcessAllTemplates(
+			cfg.SourceDir,
+			"", // Pages go into the archive, not an output tree
+			cfg.OutputFormat,
+			false, // Not validate-only mode
+		)
+		if err != nil {
+			return fmt.Errorf("error processing templates: %w", err)
+		}
 
-	// Output summary
-	cfg.Logger.Infof("Successfully processed %d templates", len(metadata))
+		// Write all pages into one archive
+		htmlGenerator := html.NewGenerator(cfg.Logger)
+		if err := htmlGenerator.GenerateArchive(metadata, cfg.OutputArchive); err != nil {
+			return fmt.Errorf("error generating HTML documentation archive: %w", err)
+		}
 
-	// Generate documentation
-	if cfg.OutputFormat == "html" {
+		cfg.Logger.Infof("Successfully processed %d templates", len(metadata))
+		cfg.Logger.Infof("HTML documentation archive written to %s", cfg.OutputArchive)
+	} else if cfg.OutputFormat == "html" {
 		// Create HTML generator
 		htmlGenerator := html.NewGenerator(cfg.Logger)
 
-		// Generate HTML documentation
-		if err := htmlGenerator.GenerateDocumentation(metadata, cfg.OutputDir); err != nil {
+		// Render template pages on a pool of workers while templates are
+		// still being processed
+		htmlGenerator.SetConcurrency(cfg.Concurrency)
+		pages := htmlGenerator.NewPageQueue(cfg.OutputDir)
+
+		// Hand each template to the page workers as soon as it is processed
+		// and keep only what the index needs
+		metadata = []*template.TemplateMetadata{}
+		err = processor.ProcessTemplatesFunc(
+			cfg.SourceDir,
+			cfg.OutputDir,
+			cfg.OutputFormat,
+			false, // Not validate-only mode
+			func(m *template.TemplateMetadata) error {
+				metadata = append(metadata, html.IndexEntry(m))
+				pages.Add(m)
+				return nil
+			},
+		)
+		pages.Close()
+		if err != nil {
+			return fmt.Errorf("error processing templates: %w", err)
+		}
+
+		// Index and CSS need the full template list
+		if err := htmlGenerator.GenerateIndex(metadata, cfg.OutputDir); err != nil {
 			return fmt.Errorf("error generating HTML documentation: %w", err)
 		}
 
+		cfg.Logger.Infof("Successfully processed %d templates", len(metadata))
 		cfg.Logger.Infof("HTML documentation generated in %s", cfg.OutputDir)
+	} else {
+		metadata, err = processor.ProcessAllTemplates(
+			cfg.SourceDir,
+			cfg.OutputDir,
+			cfg.OutputFormat,
+			false, // Not validate-only mode
+		)
+		if err != nil {
+			return fmt.Errorf("error processing templates: %w", err)
+		}
+
+		// Output summary
+		cfg.Logger.Infof("Successfully processed %d templates", len(metadata))
 	}
 
 	// If processing JSON format, output metadata to a file
 	if cfg.OutputFormat == "json" {
-		metadataFile := fmt.Sprintf("%s/metadata.json", cfg.OutputDir)
-		jsonData, err := json.MarshalIndent(metadata, "", "  ")
-		if err != nil {
-			return fmt.Errorf("error generating JSON metadata: %w", err)
-		}
-
-		if err := os.WriteFile(metadataFile, jsonData, 0644); err != nil {
-			return fmt.Errorf("error writing JSON metadata: %w", err)
+		metadataFile := filepath.Join(cfg.OutputDir, "metadata.json")
+		if err := writeMetadataJSON(metadataFile, metadata); err != nil {
+			return err
 		}
 
 		cfg.Logger.Infof("Metadata written to %s", metadataFile)
@@ -111,3 +163,34 @@ func runGenerate(ctx context.Context) error {
 
 	return nil
 }
+
+// setValidationCache keeps validation results in the user cache, outside
+// the docs tree that serve and publishing expose, so unchanged templates
+// skip schema validation on later generate and validate runs
+func setValidationCache(processor *template.Processor) {
+	if cacheDir := schema.DefaultCacheDir(); cacheDir != "" {
+		processor.SetValidationCacheFile(filepath.Join(cacheDir, "validation.json"))
+	}
+}
+
+// writeMetadataJSON encodes metadata straight into a buffered file instead
+// of building the whole indented document in memory first
+func writeMetadataJSON(path string, metadata []*template.TemplateMetadata) error {
+	file, err := os.Create(path)
+	if err != nil {
+		return fmt.Errorf("error writing JSON metadata: %w", err)
+	}
+	defer file.Close()
+
+	buf := bufio.NewWriter(file)
+	encoder := json.NewEncoder(buf)
+	encoder.SetIndent("", "  ")
+	if err := encoder.Encode(metadata); err != nil {
+		return fmt.Errorf("error generating JSON metadata: %w", err)
+	}
+
+	if err := buf.Flush(); err != nil {
+		return fmt.Errorf("error writing JSON metadata: %w", err)
+	}
+	return file.Close()
+}
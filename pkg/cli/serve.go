@@ -54,10 +54,13 @@ func runServe(ctx context.Context) error {
 
 		// We need to configure the generate command to use our output directory
 		// but we can't pass the -d flag directly because generate uses different flags
+		// Serving needs the pages on disk, so archive mode is always switched
+		// off here even when OUTPUT_ARCHIVE is set
 		generateCmd.SetArgs([]string{
 			"--output", cfg.OutputDir,
 			"--format", cfg.OutputFormat,
 			"--source", cfg.SourceDir,
+			"--archive=",
 		})
 
 		err := generateCmd.ExecuteContext(ctx)
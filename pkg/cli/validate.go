@@ -54,6 +54,8 @@ func runValidate(ctx context.Context) error {
 	// Create template processor with schema manager
 	processor := template.NewProcessor(cfg.Logger)
 	processor.SetSchemaManager(schemaManager)
+	processor.SetConcurrency(cfg.Concurrency)
+	setValidationCache(processor)
 
 	// Process all templates in validate-only mode
 	cfg.Logger.Info("Validating templates from ", cfg.SourceDir)
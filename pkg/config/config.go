@@ -12,9 +12,10 @@ import (
 // Config represents application configuration
 type Config struct {
 	// Input/Output
-	SourceDir    string
-	OutputDir    string
-	OutputFormat string
+	SourceDir     string
+	OutputDir     string
+	OutputFormat  string
+	OutputArchive string
 
 	// Processing options
 	ValidateOnly bool
@@ -29,13 +30,14 @@ type Config struct {
 func DefaultConfig() *Config {
 	config := &Config{
 		// Default values
-		SourceDir:    GetEnvOrDefault("SOURCE_DIR", "templates"),
-		OutputDir:    GetEnvOrDefault("OUTPUT_DIR", "docs/output"),
-		OutputFormat: GetEnvOrDefault("FORMAT", "html"),
-		ValidateOnly: strings.ToLower(GetEnvOrDefault("VALIDATE_ONLY", "false")) == "true",
-		Verbose:      strings.ToLower(GetEnvOrDefault("VERBOSE", "false")) == "true",
-		Concurrency:  4, // Default to 4 workers
-		Logger:       logrus.New(),
+		SourceDir:     GetEnvOrDefault("SOURCE_DIR", "templates"),
+		OutputDir:     GetEnvOrDefault("OUTPUT_DIR", "docs/output"),
+		OutputFormat:  GetEnvOrDefault("FORMAT", "html"),
+		OutputArchive: GetEnvOrDefault("OUTPUT_ARCHIVE", ""),
+		ValidateOnly:  strings.ToLower(GetEnvOrDefault("VALIDATE_ONLY", "false")) == "true",
+		Verbose:       strings.ToLower(GetEnvOrDefault("VERBOSE", "false")) == "true",
+		Concurrency:   4, // Default to 4 workers
+		Logger:        logrus.New(),
 	}
 
 	// Configure logger
@@ -61,6 +63,7 @@ func (c *Config) WithArgs(args []string) *Config {
 	fs.StringVar(&c.SourceDir, "source", c.SourceDir, "Source directory containing templates")
 	fs.StringVar(&c.OutputDir, "output", c.OutputDir, "Output directory for documentation")
 	fs.StringVar(&c.OutputFormat, "format", c.OutputFormat, "Output format (html, markdown, json)")
+	fs.StringVar(&c.OutputArchive, "archive", c.OutputArchive, "Write HTML documentation to a single zip archive instead of individual files")
 	fs.BoolVar(&c.ValidateOnly, "validate", c.ValidateOnly, "Validate templates without generating documentation")
 	fs.BoolVar(&c.Verbose, "verbose", c.Verbose, "Enable verbose logging")
 	fs.IntVar(&c.Concurrency, "concurrency", c.Concurrency, "Number of concurrent workers")
@@ -103,11 +106,12 @@ func (c *Config) Validate() error {
 		return fmt.Errorf("source directory does not exist: %s", c.SourceDir)
 	}
 
-	// Validate output format
+	// Validate output format, normalising it so callers can compare it exactly
 	validFormats := []string{"html", "markdown", "json"}
 	formatValid := false
 	for _, format := range validFormats {
 		if strings.EqualFold(c.OutputFormat, format) {
+			c.OutputFormat = format
 			formatValid = true
 			break
 		}
@@ -116,6 +120,11 @@ func (c *Config) Validate() error {
 		return fmt.Errorf("invalid output format: %s. Must be one of %v", c.OutputFormat, validFormats)
 	}
 
+	// An archive only holds HTML documentation
+	if c.OutputArchive != "" && c.OutputFormat != "html" {
+		return fmt.Errorf("archive output requires html format, got %s", c.OutputFormat)
+	}
+
 	// Validate concurrency
 	if c.Concurrency < 1 {
 		return fmt.Errorf("concurrency must be at least 1, got %d", c.Concurrency)
@@ -2,6 +2,7 @@ package config
 
 import (
 	"os"
+	"strings"
 	"testing"
 
 	"github.com/sirupsen/logrus"
@@ -50,6 +51,9 @@ func TestDefaultConfig(t *testing.T) {
 	if config.Concurrency != 4 {
 		t.Errorf("Expected default Concurrency to be 4, got %d", config.Concurrency)
 	}
+	if config.OutputArchive != "" {
+		t.Errorf("Expected default OutputArchive to be empty, got '%s'", config.OutputArchive)
+	}
 	if config.Logger == nil {
 		t.Error("Expected Logger to be initialized")
 	}
@@ -163,6 +167,7 @@ func TestConfigValidate(t *testing.T) {
 		sourceDir   string
 		outputDir   string
 		format      string
+		archive     string
 		concurrency int
 		expectError bool
 	}{
@@ -198,16 +203,44 @@ func TestConfigValidate(t *testing.T) {
 			concurrency: 0,
 			expectError: true,
 		},
+		{
+			name:        "Archive with html format",
+			sourceDir:   tempDir,
+			outputDir:   "docs/output",
+			format:      "html",
+			archive:     "docs.zip",
+			concurrency: 4,
+			expectError: false,
+		},
+		{
+			name:        "Archive with uppercase html format",
+			sourceDir:   tempDir,
+			outputDir:   "docs/output",
+			format:      "HTML",
+			archive:     "docs.zip",
+			concurrency: 4,
+			expectError: false,
+		},
+		{
+			name:        "Archive with json format",
+			sourceDir:   tempDir,
+			outputDir:   "docs/output",
+			format:      "json",
+			archive:     "docs.zip",
+			concurrency: 4,
+			expectError: true,
+		},
 	}
 
 	for _, test := range tests {
 		t.Run(test.name, func(t *testing.T) {
 			config := &Config{
-				SourceDir:    test.sourceDir,
-				OutputDir:    test.outputDir,
-				OutputFormat: test.format,
-				Concurrency:  test.concurrency,
-				Logger:       logrus.New(),
+				SourceDir:     test.sourceDir,
+				OutputDir:     test.outputDir,
+				OutputFormat:  test.format,
+				OutputArchive: test.archive,
+				Concurrency:   test.concurrency,
+				Logger:        logrus.New(),
 			}
 
 			err := config.Validate()
@@ -216,6 +249,9 @@ func TestConfigValidate(t *testing.T) {
 			} else if !test.expectError && err != nil {
 				t.Errorf("Expected no error but got: %v", err)
 			}
+			if err == nil && config.OutputFormat != strings.ToLower(test.format) {
+				t.Errorf("Expected OutputFormat to be normalised to '%s', got '%s'", strings.ToLower(test.format), config.OutputFormat)
+			}
 		})
 	}
 }
@@ -1,10 +1,20 @@
 package html
 
 import (
+	"archive/zip"
+	"bufio"
+	"bytes"
+	_ "embed"
 	"fmt"
 	"html/template"
+	"io"
 	"os"
+	"path"
 	"path/filepath"
+	"runtime"
+	"sort"
+	"sync"
+	"time"
 
 	tmpl "github.com/ka1ne/template-doc-gen/pkg/template"
 	"github.com/sirupsen/logrus"
@@ -12,17 +22,33 @@ import (
 
 // Generator handles HTML generation for template documentation
 type Generator struct {
-	logger    *logrus.Logger
-	templates *template.Template
-}
+	logger      *logrus.Logger
+	templates   *template.Template
+	concurrency int
+	createdDirs map[string]struct{}
+	dirsMutex   sync.Mutex
+}
+
+// pageTemplates holds the parsed index and template page layouts. They are
+// parsed once per process and shared by every generator; html/template
+// also caches its escaping analysis on first execution, so that work is
+// not repeated either.
+var (
+	pageTemplates     *template.Template
+	pageTemplatesOnce sync.Once
+)
 
-// NewGenerator creates a new HTML generator
-func NewGenerator(logger *logrus.Logger) *Generator {
-	if logger == nil {
-		logger = logrus.New()
-	}
+// loadPageTemplates parses the page templates on first use, so commands
+// that never render HTML, such as validate or --help, skip it at startup
+func loadPageTemplates() *template.Template {
+	pageTemplatesOnce.Do(func() {
+		pageTemplates = parsePageTemplates()
+	})
+	return pageTemplates
+}
 
-	// Initialize and parse templates
+// parsePageTemplates parses all page templates with their helper functions
+func parsePageTemplates() *template.Template {
 	templates := template.New("").Funcs(template.FuncMap{
 		"dict": func(values ...interface{}) (map[string]interface{}, error) {
 			if len(values)%2 != 0 {
@@ -47,98 +73,422 @@ func NewGenerator(logger *logrus.Logger) *Generator {
 	templates = template.Must(templates.Parse(indexTemplate))
 	templates = template.Must(templates.Parse(templateDetailsTemplate))
 
+	return templates
+}
+
+// NewGenerator creates a new HTML generator
+func NewGenerator(logger *logrus.Logger) *Generator {
+	if logger == nil {
+		logger = logrus.New()
+	}
+
 	return &Generator{
-		logger:    logger,
-		templates: templates,
+		logger:      logger,
+		templates:   loadPageTemplates(),
+		createdDirs: make(map[string]struct{}),
 	}
 }
 
+// SetConcurrency sets how many template pages are rendered at once.
+// Values below 1 use one worker per CPU.
+func (g *Generator) SetConcurrency(workers int) {
+	g.concurrency = workers
+}
+
 // GenerateDocumentation generates HTML documentation for templates
 func (g *Generator) GenerateDocumentation(metadata []*tmpl.TemplateMetadata, outputDir string) error {
-	// Create index file with links to all templates
-	if err := g.generateIndexFile(metadata, outputDir); err != nil {
-		return err
-	}
-
-	// Generate CSS file
-	if err := g.generateCSSFile(outputDir); err != nil {
+	// Create index and CSS files
+	if err := g.GenerateIndex(metadata, outputDir); err != nil {
 		return err
 	}
 
 	// Generate individual template documentation files
+	pages := g.NewPageQueue(outputDir)
 	for _, m := range metadata {
-		if err := g.generateTemplateFile(m, outputDir); err != nil {
-			g.logger.Errorf("Error generating documentation for %s: %v", m.Name, err)
-		}
+		pages.Add(m)
 	}
+	pages.Close()
 
 	return nil
 }
 
+// PageQueue renders template pages on a pool of workers as they are added
+type PageQueue struct {
+	pages chan *tmpl.TemplateMetadata
+	wg    sync.WaitGroup
+}
+
+// NewPageQueue starts the page workers for outputDir. Callers add pages as
+// they become available and call Close once all pages have been added.
+func (g *Generator) NewPageQueue(outputDir string) *PageQueue {
+	workers := g.concurrency
+	if workers < 1 {
+		workers = runtime.NumCPU()
+	}
+
+	q := &PageQueue{pages: make(chan *tmpl.TemplateMetadata, workers)}
+	for w := 0; w < workers; w++ {
+		q.wg.Add(1)
+		go func() {
+			defer q.wg.Done()
+			for m := range q.pages {
+				if err := g.GenerateTemplatePage(m, outputDir); err != nil {
+					g.logger.Errorf("Error generating documentation for %s: %v", m.Name, err)
+				}
+			}
+		}()
+	}
+	return q
+}
+
+// Add queues a template page for rendering
+func (q *PageQueue) Add(metadata *tmpl.TemplateMetadata) {
+	q.pages <- metadata
+}
+
+// Close waits for every queued page to be written
+func (q *PageQueue) Close() {
+	close(q.pages)
+	q.wg.Wait()
+}
+
+// GenerateIndex generates the index page and the assets shared by all template pages
+func (g *Generator) GenerateIndex(metadata []*tmpl.TemplateMetadata, outputDir string) error {
+	// Create index file with links to all templates
+	if err := g.generateIndexFile(metadata, outputDir); err != nil {
+		return err
+	}
+
+	// Generate the stylesheet and page script
+	return g.generateAssetFiles(outputDir)
+}
+
+// GenerateTemplatePage generates the documentation page for a single template
+func (g *Generator) GenerateTemplatePage(metadata *tmpl.TemplateMetadata, outputDir string) error {
+	return g.generateTemplateFile(metadata, outputDir)
+}
+
 // generateIndexFile creates an index.html file with links to all templates
 func (g *Generator) generateIndexFile(metadata []*tmpl.TemplateMetadata, outputDir string) error {
 	indexPath := filepath.Join(outputDir, "index.html")
 	g.logger.Infof("Generating index file: %s", indexPath)
 
-	// Group templates by type
+	// Stream the index through a 64 KiB buffer into a temporary file, so
+	// memory stays bounded however many templates it lists, then keep the
+	// existing index when nothing changed
+	tmp, err := os.CreateTemp(outputDir, ".index.html.*.tmp")
+	if err != nil {
+		return fmt.Errorf("error creating index file: %w", err)
+	}
+	defer os.Remove(tmp.Name())
+
+	buf := bufio.NewWriterSize(tmp, 64*1024)
+	err = g.templates.ExecuteTemplate(buf, "index.html", indexData(metadata))
+	if err == nil {
+		err = buf.Flush()
+	}
+	if closeErr := tmp.Close(); err == nil {
+		err = closeErr
+	}
+	if err != nil {
+		return fmt.Errorf("error executing index template: %w", err)
+	}
+
+	if filesEqual(tmp.Name(), indexPath) {
+		g.logger.Debugf("Index file is up to date: %s", indexPath)
+		return nil
+	}
+
+	if err := os.Chmod(tmp.Name(), 0644); err != nil {
+		return fmt.Errorf("error writing index file: %w", err)
+	}
+	if err := os.Rename(tmp.Name(), indexPath); err != nil {
+		return fmt.Errorf("error writing index file: %w", err)
+	}
+
+	return nil
+}
+
+// IndexEntry returns a copy of metadata holding only the fields the index
+// page renders, so callers that collect every template for the index do
+// not keep variables, parameters and the raw template alive
+func IndexEntry(metadata *tmpl.TemplateMetadata) *tmpl.TemplateMetadata {
+	return &tmpl.TemplateMetadata{
+		Name:        metadata.Name,
+		Identifier:  metadata.Identifier,
+		Type:        metadata.Type,
+		Description: metadata.Description,
+		Version:     metadata.Version,
+		Tags:        metadata.Tags,
+	}
+}
+
+// indexData groups templates by type for the index template. A single sort
+// by type, name and identifier lets each group be a subslice of the sorted
+// copy, and keeps the index identical however the workers delivered the
+// templates. The index lists groups in ValidTypes order on its own.
+func indexData(metadata []*tmpl.TemplateMetadata) map[string]interface{} {
+	sorted := make([]*tmpl.TemplateMetadata, len(metadata))
+	copy(sorted, metadata)
+	sort.Slice(sorted, func(i, j int) bool {
+		a, b := sorted[i], sorted[j]
+		if a.Type != b.Type {
+			return a.Type < b.Type
+		}
+		if a.Name != b.Name {
+			return a.Name < b.Name
+		}
+		return a.Identifier < b.Identifier
+	})
+
 	templatesByType := make(map[string][]*tmpl.TemplateMetadata)
-	for _, m := range metadata {
-		templatesByType[m.Type] = append(templatesByType[m.Type], m)
+	for start := 0; start < len(sorted); {
+		end := start + 1
+		for end < len(sorted) && sorted[end].Type == sorted[start].Type {
+			end++
+		}
+		templatesByType[sorted[start].Type] = sorted[start:end:end]
+		start = end
 	}
 
-	// Create template data
-	data := map[string]interface{}{
+	return map[string]interface{}{
 		"TemplatesByType": templatesByType,
 		"ValidTypes":      tmpl.ValidTemplateTypes,
 	}
+}
+
+// GenerateArchive writes the index, stylesheet and every template page into
+// a single zip archive. Entries are stored uncompressed, so the archive costs
+// one file on disk instead of one per page without spending CPU on deflate.
+func (g *Generator) GenerateArchive(metadata []*tmpl.TemplateMetadata, archivePath string) error {
+	g.logger.Infof("Generating documentation archive: %s", archivePath)
 
-	// Create file
-	file, err := os.Create(indexPath)
+	file, err := os.Create(archivePath)
 	if err != nil {
-		return fmt.Errorf("error creating index file: %w", err)
+		return fmt.Errorf("error creating archive file: %w", err)
 	}
 	defer file.Close()
 
-	// Execute template
-	if err := g.templates.ExecuteTemplate(file, "index.html", data); err != nil {
+	buf := bufio.NewWriterSize(file, 64*1024)
+	archive := zip.NewWriter(buf)
+	modified := time.Now()
+
+	// Add a stored entry and return its writer
+	createEntry := func(name string) (io.Writer, error) {
+		return archive.CreateHeader(&zip.FileHeader{
+			Name:     name,
+			Method:   zip.Store,
+			Modified: modified,
+		})
+	}
+
+	entry, err := createEntry("index.html")
+	if err != nil {
+		return fmt.Errorf("error adding index to archive: %w", err)
+	}
+	if err := g.templates.ExecuteTemplate(entry, "index.html", indexData(metadata)); err != nil {
 		return fmt.Errorf("error executing index template: %w", err)
 	}
 
+	entry, err = createEntry("styles.css")
+	if err != nil {
+		return fmt.Errorf("error adding CSS to archive: %w", err)
+	}
+	if _, err := entry.Write(cssBytes); err != nil {
+		return fmt.Errorf("error writing CSS to archive: %w", err)
+	}
+
+	entry, err = createEntry("page.js")
+	if err != nil {
+		return fmt.Errorf("error adding page script to archive: %w", err)
+	}
+	if _, err := entry.Write(pageScriptBytes); err != nil {
+		return fmt.Errorf("error writing page script to archive: %w", err)
+	}
+
+	// Render each page in full before adding its entry, so a page that
+	// fails to render is left out rather than stored truncated
+	page := pageBuffers.Get().(*bytes.Buffer)
+	defer pageBuffers.Put(page)
+
+	for _, m := range metadata {
+		page.Reset()
+		if err := g.templates.ExecuteTemplate(page, "template.html", m); err != nil {
+			g.logger.Errorf("Error generating documentation for %s: %v", m.Name, err)
+			continue
+		}
+
+		entry, err = createEntry(path.Join(m.Type, m.Identifier+".html"))
+		if err != nil {
+			return fmt.Errorf("error adding template %s to archive: %w", m.Name, err)
+		}
+		if _, err := entry.Write(page.Bytes()); err != nil {
+			return fmt.Errorf("error writing template %s to archive: %w", m.Name, err)
+		}
+	}
+
+	if err := archive.Close(); err != nil {
+		return fmt.Errorf("error finalizing archive: %w", err)
+	}
+	if err := buf.Flush(); err != nil {
+		return fmt.Errorf("error writing archive: %w", err)
+	}
+	return file.Close()
+}
+
+// generateAssetFiles writes the stylesheet and page script shared by all
+// template pages
+func (g *Generator) generateAssetFiles(outputDir string) error {
+	if err := g.writeAssetFile(outputDir, "styles.css", cssBytes); err != nil {
+		return fmt.Errorf("error writing CSS file: %w", err)
+	}
+	if err := g.writeAssetFile(outputDir, "page.js", pageScriptBytes); err != nil {
+		return fmt.Errorf("error writing page script: %w", err)
+	}
 	return nil
 }
 
-// generateCSSFile creates the CSS file for styling the documentation
-func (g *Generator) generateCSSFile(outputDir string) error {
-	cssPath := filepath.Join(outputDir, "styles.css")
-	g.logger.Infof("Generating CSS file: %s", cssPath)
+// writeAssetFile writes a static asset into the output directory
+func (g *Generator) writeAssetFile(outputDir string, name string, content []byte) error {
+	assetPath := filepath.Join(outputDir, name)
+
+	// Skip the write when the file on disk is already current
+	if fileHasContent(assetPath, content) {
+		g.logger.Debugf("Asset file is up to date: %s", assetPath)
+		return nil
+	}
 
-	return os.WriteFile(cssPath, []byte(cssStyles), 0644)
+	g.logger.Infof("Generating asset file: %s", assetPath)
+
+	// Write to a temporary file and rename it into place so the asset is
+	// never left half written
+	tmp, err := os.CreateTemp(outputDir, "."+name+".*.tmp")
+	if err != nil {
+		return err
+	}
+	_, err = tmp.Write(content)
+	if closeErr := tmp.Close(); err == nil {
+		err = closeErr
+	}
+	if err == nil {
+		err = os.Chmod(tmp.Name(), 0644)
+	}
+	if err == nil {
+		err = os.Rename(tmp.Name(), assetPath)
+	}
+	if err != nil {
+		os.Remove(tmp.Name())
+		return err
+	}
+	return nil
 }
 
 // generateTemplateFile creates an HTML file for a specific template
 func (g *Generator) generateTemplateFile(metadata *tmpl.TemplateMetadata, outputDir string) error {
 	// Create directory for template type if it doesn't exist
 	typeDir := filepath.Join(outputDir, metadata.Type)
-	if err := os.MkdirAll(typeDir, 0755); err != nil {
+	if err := g.ensureDir(typeDir); err != nil {
 		return fmt.Errorf("error creating directory for template type: %w", err)
 	}
 
 	// Create HTML file path
-	filePath := filepath.Join(typeDir, fmt.Sprintf("%s.html", metadata.Identifier))
+	filePath := filepath.Join(typeDir, metadata.Identifier+".html")
 	g.logger.Infof("Generating template documentation: %s", filePath)
 
-	// Create file
-	file, err := os.Create(filePath)
+	// Render into a pooled buffer first so an unchanged page is not rewritten
+	buf := pageBuffers.Get().(*bytes.Buffer)
+	buf.Reset()
+	defer pageBuffers.Put(buf)
+
+	if err := g.templates.ExecuteTemplate(buf, "template.html", metadata); err != nil {
+		return fmt.Errorf("error executing template: %w", err)
+	}
+
+	if fileHasContent(filePath, buf.Bytes()) {
+		g.logger.Debugf("Template documentation is up to date: %s", filePath)
+		return nil
+	}
+
+	if err := os.WriteFile(filePath, buf.Bytes(), 0644); err != nil {
+		return fmt.Errorf("error writing template file: %w", err)
+	}
+
+	return nil
+}
+
+// pageBuffers recycles render buffers across template pages, whether they
+// are written to disk or added to an archive. The index streams through a
+// temporary file instead, so it is never held in memory whole.
+var pageBuffers = sync.Pool{
+	New: func() interface{} { return new(bytes.Buffer) },
+}
+
+// fileHasContent reports whether the file at path already holds exactly
+// content. A size mismatch settles it from the stat alone, without reading
+// the file.
+func fileHasContent(path string, content []byte) bool {
+	info, err := os.Stat(path)
+	if err != nil || info.Size() != int64(len(content)) {
+		return false
+	}
+	existing, err := os.ReadFile(path)
+	return err == nil && bytes.Equal(existing, content)
+}
+
+// filesEqual reports whether two files hold the same bytes. Sizes are
+// compared from the stat first, and contents are compared in 64 KiB
+// chunks, so neither file is read into memory whole.
+func filesEqual(pathA, pathB string) bool {
+	infoA, err := os.Stat(pathA)
 	if err != nil {
-		return fmt.Errorf("error creating template file: %w", err)
+		return false
+	}
+	infoB, err := os.Stat(pathB)
+	if err != nil || infoA.Size() != infoB.Size() {
+		return false
 	}
-	defer file.Close()
 
-	// Execute template
-	if err := g.templates.ExecuteTemplate(file, "template.html", metadata); err != nil {
-		return fmt.Errorf("error executing template: %w", err)
+	fileA, err := os.Open(pathA)
+	if err != nil {
+		return false
 	}
+	defer fileA.Close()
+	fileB, err := os.Open(pathB)
+	if err != nil {
+		return false
+	}
+	defer fileB.Close()
+
+	chunkA := make([]byte, 64*1024)
+	chunkB := make([]byte, 64*1024)
+	for {
+		n, errA := io.ReadFull(fileA, chunkA)
+		m, errB := io.ReadFull(fileB, chunkB)
+		if n != m || !bytes.Equal(chunkA[:n], chunkB[:m]) {
+			return false
+		}
+		if errA == io.EOF || errA == io.ErrUnexpectedEOF {
+			return errB == errA
+		}
+		if errA != nil || errB != nil {
+			return false
+		}
+	}
+}
+
+// ensureDir creates a directory once per generator, skipping MkdirAll's
+// stat calls for directories this generator has already created
+func (g *Generator) ensureDir(dir string) error {
+	g.dirsMutex.Lock()
+	defer g.dirsMutex.Unlock()
 
+	if _, ok := g.createdDirs[dir]; ok {
+		return nil
+	}
+	if err := os.MkdirAll(dir, 0755); err != nil {
+		return err
+	}
+	g.createdDirs[dir] = struct{}{}
 	return nil
 }
 
@@ -460,625 +810,19 @@ const templateDetailsTemplate = `
 
     <script src="https://cdnjs.cloudflare.com/ajax/libs/highlight.js/11.7.0/highlight.min.js"></script>
     <script src="https://cdnjs.cloudflare.com/ajax/libs/highlight.js/11.7.0/languages/yaml.min.js"></script>
-    <script>
-        document.addEventListener('DOMContentLoaded', function() {
-            // Initialize syntax highlighting
-            hljs.highlightAll();
-            
-            // Back to top functionality
-            document.getElementById('backToTop').addEventListener('click', function(e) {
-                e.preventDefault();
-                window.scrollTo({ top: 0, behavior: 'smooth' });
-            });
-            
-            // Highlight active section in sidebar
-            const sections = document.querySelectorAll('.metadata-section');
-            const navLinks = document.querySelectorAll('.sidebar-nav a');
-            
-            function highlightNavigation() {
-                let scrollPosition = window.scrollY + 100;
-                
-                sections.forEach(section => {
-                    const sectionTop = section.offsetTop;
-                    const sectionHeight = section.offsetHeight;
-                    
-                    if (scrollPosition >= sectionTop && scrollPosition < sectionTop + sectionHeight) {
-                        const id = section.getAttribute('id');
-                        
-                        navLinks.forEach(link => {
-                            link.classList.remove('active');
-                            if (link.getAttribute('href') === '#' + id) {
-                                link.classList.add('active');
-                            }
-                        });
-                    }
-                });
-            }
-            
-            window.addEventListener('scroll', highlightNavigation);
-            highlightNavigation();
-        });
-    </script>
+    <script src="../page.js"></script>
 </body>
 </html>
 {{end}}
 `
 
-// CSS Styles
-const cssStyles = `:root {
-    --primary-color: #0078D4;
-    --secondary-color: #106EBE;
-    --accent-color: #2B88D8;
-    --light-bg: #F8F9FA;
-    --dark-text: #333333;
-    --light-text: #666666;
-    --card-border: #E1E1E1;
-    --code-bg: #F5F5F5;
-    --shadow: 0 2px 4px rgba(0,0,0,0.1);
-}
-
-* {
-    box-sizing: border-box;
-    margin: 0;
-    padding: 0;
-}
-
-body {
-    font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, Oxygen, Ubuntu, Cantarell, 'Open Sans', 'Helvetica Neue', sans-serif;
-    line-height: 1.6;
-    color: var(--dark-text);
-    background-color: #ffffff;
-    max-width: 1200px;
-    margin: 0 auto;
-    padding: 20px;
-}
-
-header {
-    margin-bottom: 30px;
-    padding-bottom: 20px;
-    border-bottom: 1px solid var(--card-border);
-}
-
-h1 {
-    color: var(--primary-color);
-    margin-bottom: 10px;
-}
-
-h2 {
-    color: var(--secondary-color);
-    margin: 20px 0 15px 0;
-    padding-bottom: 10px;
-    border-bottom: 1px solid var(--card-border);
-}
-
-h3 {
-    color: var(--accent-color);
-    margin: 25px 0 10px 0;
-}
-
-a {
-    color: var(--primary-color);
-    text-decoration: none;
-}
-
-a:hover {
-    text-decoration: underline;
-}
-
-ul {
-    list-style-type: none;
-}
-
-/* Search and Filtering */
-.search-container {
-    margin: 20px 0;
-}
-
-.search-input {
-    width: 100%;
-    padding: 10px;
-    border: 1px solid var(--card-border);
-    border-radius: 4px;
-    font-size: 16px;
-    margin-bottom: 10px;
-}
-
-.filter-options {
-    display: flex;
-    flex-wrap: wrap;
-    gap: 15px;
-    margin-bottom: 10px;
-}
-
-.filter-options label {
-    display: flex;
-    align-items: center;
-    gap: 5px;
-    cursor: pointer;
-}
-
-/* Template List */
-.template-type {
-    margin-bottom: 30px;
-}
-
-.template-list li {
-    background-color: var(--light-bg);
-    padding: 15px;
-    margin-bottom: 10px;
-    border-radius: 5px;
-    border-left: 4px solid var(--primary-color);
-    box-shadow: var(--shadow);
-    transition: transform 0.2s, box-shadow 0.2s;
-}
-
-.template-list li:hover {
-    transform: translateY(-2px);
-    box-shadow: 0 4px 8px rgba(0,0,0,0.15);
-}
-
-.version {
-    background-color: var(--primary-color);
-    color: white;
-    padding: 2px 6px;
-    border-radius: 3px;
-    font-size: 0.8em;
-    margin-left: 10px;
-}
-
-.description {
-    color: var(--light-text);
-    font-size: 0.9em;
-    margin-top: 5px;
-}
-
-.tag-list-small {
-    display: flex;
-    flex-wrap: wrap;
-    gap: 5px;
-    margin-top: 10px;
-}
-
-.tag-small {
-    background-color: rgba(0,0,0,0.05);
-    padding: 2px 6px;
-    border-radius: 3px;
-    font-size: 0.75em;
-    color: var(--light-text);
-}
-
-/* Harness-style layout */
-.page-container {
-    max-width: 1200px;
-    margin: 0 auto;
-    padding: 0;
-    position: relative;
-}
-
-.back-navigation {
-    position: absolute;
-    top: 20px;
-    left: 20px;
-    z-index: 10;
-}
-
-.back-link {
-    display: inline-flex;
-    align-items: center;
-    font-size: 14px;
-    font-weight: 500;
-    color: var(--primary-color);
-    text-decoration: none;
-}
-
-.back-link:hover {
-    text-decoration: underline;
-}
-
-.main-content-wrapper {
-    display: flex;
-    padding: 20px;
-    padding-top: 60px; /* Space for back button */
-}
-
-.main-content {
-    flex: 1;
-    max-width: calc(100% - 280px);
-    padding-right: 30px;
-}
-
-.content-area {
-    max-width: 100%;
-}
-
-.right-sidebar {
-    width: 260px;
-    flex-shrink: 0;
-    position: relative;
-}
-
-.sidebar-sticky {
-    position: sticky;
-    top: 20px;
-    background-color: var(--light-bg);
-    border-radius: 6px;
-    border: 1px solid var(--card-border);
-    padding: 5px 0;
-    margin-top: 60px; /* Align with content */
-}
-
-.sidebar-header {
-    padding: 15px 20px;
-    border-bottom: 1px solid var(--card-border);
-}
-
-.sidebar-header h3 {
-    margin: 0;
-    font-size: 15px;
-    font-weight: 600;
-    color: var(--dark-text);
-}
-
-.sidebar-nav ul {
-    list-style: none;
-    padding: 10px 0;
-    margin: 0;
-}
-
-.sidebar-nav li {
-    margin: 0;
-}
-
-.sidebar-nav .nav-link {
-    display: block;
-    padding: 8px 20px;
-    color: var(--dark-text);
-    font-size: 14px;
-    border-left: 3px solid transparent;
-    transition: all 0.2s;
-}
+// cssBytes holds the stylesheet, embedded from styles.css at build time
+//
+//go:embed styles.css
+var cssBytes []byte
 
-.sidebar-nav .nav-link:hover,
-.sidebar-nav .nav-link.active {
-    background-color: rgba(0, 120, 212, 0.08);
-    border-left-color: var(--primary-color);
-    text-decoration: none;
-    color: var(--primary-color);
-}
-
-@media (max-width: 992px) {
-    .main-content-wrapper {
-        flex-direction: column;
-        padding-top: 80px;
-    }
-    
-    .main-content {
-        max-width: 100%;
-        padding-right: 0;
-    }
-    
-    .right-sidebar {
-        width: 100%;
-        margin-top: 30px;
-    }
-    
-    .sidebar-sticky {
-        position: relative;
-        top: 0;
-        margin-top: 0;
-    }
-    
-    .sidebar-nav ul {
-        display: flex;
-        flex-wrap: wrap;
-        padding: 10px;
-    }
-    
-    .sidebar-nav li {
-        margin-right: 5px;
-        margin-bottom: 5px;
-    }
-    
-    .sidebar-nav .nav-link {
-        padding: 6px 12px;
-        border-left: none;
-        border-radius: 4px;
-        white-space: nowrap;
-    }
-    
-    .sidebar-nav .nav-link:hover,
-    .sidebar-nav .nav-link.active {
-        border-left-color: transparent;
-    }
-}
-
-/* Detail Page Layout */
-.breadcrumb {
-    margin-bottom: 15px;
-    color: var(--light-text);
-    font-size: 0.9em;
-}
-
-.metadata-section {
-    margin-bottom: 40px;
-    padding: 20px;
-    background-color: white;
-    border-radius: 5px;
-    box-shadow: var(--shadow);
-}
-
-.tag-list {
-    display: flex;
-    flex-wrap: wrap;
-    gap: 8px;
-    margin-top: 15px;
-}
-
-.tag {
-    background-color: var(--code-bg);
-    padding: 4px 10px;
-    border-radius: 20px;
-    font-size: 0.85em;
-    display: inline-block;
-}
-
-pre, code {
-    background-color: var(--code-bg);
-    padding: 10px;
-    border-radius: 5px;
-    overflow-x: auto;
-    font-family: 'Source Code Pro', monospace;
-    margin: 15px 0;
-    line-height: 1.5;
-}
-
-pre {
-    padding: 15px;
-    box-shadow: var(--shadow);
-}
-
-code {
-    display: inline-block;
-    padding-bottom: 3px;
-}
-
-.metadata-table {
-    width: 100%;
-    border-collapse: collapse;
-    margin: 15px 0;
-    border: 1px solid var(--card-border);
-    border-radius: 4px;
-    overflow: hidden;
-}
-
-.metadata-table tr:hover {
-    background-color: rgba(0,0,0,0.02);
-}
-
-.metadata-table tr {
-    border-bottom: 1px solid var(--card-border);
-}
-
-.metadata-table tr:last-child {
-    border-bottom: none;
-}
-
-.metadata-label {
-    width: 150px;
-    min-width: 150px;
-    max-width: 200px;
-    text-align: left;
-    padding: 12px;
-    font-weight: 600;
-    background-color: var(--light-bg);
-    vertical-align: top;
-}
-
-.metadata-value {
-    padding: 12px;
-    word-break: break-word;
-}
-
-.parameter-table, .variable-table {
-    width: 100%;
-    border-collapse: collapse;
-    margin: 20px 0;
-    border: 1px solid var(--card-border);
-    border-radius: 4px;
-    overflow: hidden;
-}
-
-.parameter-table th, .variable-table th {
-    text-align: left;
-    padding: 12px;
-    background-color: var(--light-bg);
-    font-weight: 600;
-}
-
-.parameter-table th:first-child, .variable-table th:first-child {
-    width: 150px;
-    min-width: 150px;
-}
-
-.parameter-table th:nth-child(2), .variable-table th:nth-child(2) {
-    width: 100px;
-    min-width: 100px;
-}
-
-.parameter-table th:last-child, .variable-table th:last-child {
-    width: 40%;
-}
-
-.parameter-table tr:not(:last-child), 
-.variable-table tr:not(:last-child) {
-    border-bottom: 1px solid var(--card-border);
-}
-
-.parameter-table td, .variable-table td {
-    vertical-align: middle;
-    padding: 12px;
-    word-break: break-word;
-}
-
-.parameter-table tr:hover, .variable-table tr:hover {
-    background-color: rgba(0,0,0,0.02);
-}
-
-.name-cell {
-    vertical-align: middle;
-    padding: 12px;
-    text-align: left;
-    width: 150px;
-    min-width: 150px;
-    max-width: 200px;
-    position: relative;
-}
-
-.field-name {
-    font-weight: 500;
-    display: inline-block;
-    white-space: nowrap;
-    overflow: hidden;
-    text-overflow: ellipsis;
-    max-width: 100%;
-}
-
-.required-col {
-    width: 100px;
-    text-align: center;
-    vertical-align: middle;
-}
-
-.required-badge {
-    display: inline-block;
-    background-color: #e8f5e9;
-    color: #2e7d32;
-    font-size: 0.85em;
-    padding: 3px 10px;
-    border-radius: 3px;
-    border: 1px solid #c8e6c9;
-    font-weight: 600;
-    min-width: 40px;
-    text-align: center;
-}
-
-.optional-text {
-    display: inline-block;
-    color: #757575;
-    font-size: 0.85em;
-    min-width: 40px;
-    text-align: center;
-}
-
-footer {
-    margin-top: 50px;
-    padding-top: 20px;
-    border-top: 1px solid var(--card-border);
-    text-align: center;
-    color: var(--light-text);
-    display: flex;
-    justify-content: space-between;
-    align-items: center;
-}
-
-#backToTop {
-    display: inline-block;
-    background-color: var(--primary-color);
-    color: white;
-    padding: 8px 15px;
-    border-radius: 4px;
-    text-decoration: none;
-    transition: background-color 0.2s;
-}
-
-#backToTop:hover {
-    background-color: var(--secondary-color);
-    text-decoration: none;
-}
-
-@media (max-width: 768px) {
-    body {
-        padding: 15px;
-    }
-    
-    .metadata-table,
-    .parameter-table, 
-    .variable-table {
-        display: block;
-        overflow-x: auto;
-        white-space: nowrap;
-        border: 1px solid var(--card-border);
-        border-radius: 4px;
-    }
-    
-    .metadata-table th,
-    .parameter-table th, 
-    .variable-table th,
-    .metadata-table td,
-    .parameter-table td, 
-    .variable-table td {
-        white-space: normal;
-    }
-    
-    .metadata-label,
-    .name-cell {
-        position: sticky;
-        left: 0;
-        background-color: var(--light-bg);
-        z-index: 1;
-        border-right: 1px solid var(--card-border);
-    }
-    
-    footer {
-        flex-direction: column;
-        gap: 15px;
-    }
-}
-
-/* Index Page Layout */
-.index-container {
-    max-width: 1200px;
-    margin: 0 auto;
-    padding: 20px;
-}
-
-.template-categories {
-    margin: 20px 0;
-    border-bottom: 1px solid var(--card-border);
-}
-
-.category-tabs {
-    display: flex;
-    flex-wrap: wrap;
-    gap: 5px;
-}
-
-.category-tab {
-    background: none;
-    border: none;
-    padding: 10px 15px;
-    font-size: 14px;
-    border-bottom: 3px solid transparent;
-    cursor: pointer;
-    color: var(--dark-text);
-    transition: all 0.2s;
-}
-
-.category-tab:hover {
-    color: var(--primary-color);
-}
-
-.category-tab.active {
-    color: var(--primary-color);
-    font-weight: 500;
-    border-bottom-color: var(--primary-color);
-}
-
-@media (max-width: 768px) {
-    .category-tabs {
-        overflow-x: auto;
-        white-space: nowrap;
-        padding-bottom: 5px;
-    }
-}
-`
+// pageScriptBytes holds the script shared by every template page, embedded
+// from page.js at build time
+//
+//go:embed page.js
+var pageScriptBytes []byte
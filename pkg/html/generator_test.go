@@ -0,0 +1,196 @@
+package html
+
+import (
+	"archive/zip"
+	"fmt"
+	"io"
+	"os"
+	"path/filepath"
+	"reflect"
+	"strings"
+	"testing"
+	"time"
+
+	tmpl "github.com/ka1ne/template-doc-gen/pkg/template"
+)
+
+func TestGenerateArchive(t *testing.T) {
+	archivePath := filepath.Join(t.TempDir(), "docs.zip")
+	metadata := []*tmpl.TemplateMetadata{
+		{Name: "Build Pipeline", Identifier: "build_pipeline", Type: tmpl.TemplatePipeline, Version: "1.0.0"},
+		{Name: "Deploy Stage", Identifier: "deploy_stage", Type: tmpl.TemplateStage, Version: "2.0.0"},
+	}
+
+	generator := NewGenerator(nil)
+	if err := generator.GenerateArchive(metadata, archivePath); err != nil {
+		t.Fatalf("Failed to generate archive: %v", err)
+	}
+
+	reader, err := zip.OpenReader(archivePath)
+	if err != nil {
+		t.Fatalf("Failed to open archive: %v", err)
+	}
+	defer reader.Close()
+
+	entries := make(map[string]string)
+	for _, file := range reader.File {
+		if file.Method != zip.Store {
+			t.Errorf("Expected %s to be stored uncompressed, got method %d", file.Name, file.Method)
+		}
+		rc, err := file.Open()
+		if err != nil {
+			t.Fatalf("Failed to open archive entry %s: %v", file.Name, err)
+		}
+		content, err := io.ReadAll(rc)
+		rc.Close()
+		if err != nil {
+			t.Fatalf("Failed to read archive entry %s: %v", file.Name, err)
+		}
+		entries[file.Name] = string(content)
+	}
+
+	expected := []string{
+		"index.html",
+		"styles.css",
+		"page.js",
+		"pipeline/build_pipeline.html",
+		"stage/deploy_stage.html",
+	}
+	if len(entries) != len(expected) {
+		t.Errorf("Expected %d archive entries, got %d", len(expected), len(entries))
+	}
+	for _, name := range expected {
+		if entries[name] == "" {
+			t.Errorf("Expected non-empty archive entry %s", name)
+		}
+	}
+
+	if !strings.Contains(entries["index.html"], `href="pipeline/build_pipeline.html"`) {
+		t.Error("Expected index to link to the pipeline page")
+	}
+	if !strings.Contains(entries["stage/deploy_stage.html"], "Deploy Stage") {
+		t.Error("Expected stage page to contain the template name")
+	}
+}
+
+func TestGenerateDocumentation(t *testing.T) {
+	outputDir := t.TempDir()
+
+	var metadata []*tmpl.TemplateMetadata
+	for i := 0; i < 6; i++ {
+		metadata = append(metadata, &tmpl.TemplateMetadata{
+			Name:       fmt.Sprintf("Stage %d", i),
+			Identifier: fmt.Sprintf("stage_%d", i),
+			Type:       tmpl.TemplateStage,
+		})
+	}
+
+	generator := NewGenerator(nil)
+	generator.SetConcurrency(3)
+	if err := generator.GenerateDocumentation(metadata, outputDir); err != nil {
+		t.Fatalf("Failed to generate documentation: %v", err)
+	}
+
+	expected := []string{"index.html", "styles.css", "page.js"}
+	for _, m := range metadata {
+		expected = append(expected, filepath.Join(m.Type, m.Identifier+".html"))
+	}
+	for _, name := range expected {
+		info, err := os.Stat(filepath.Join(outputDir, name))
+		if err != nil {
+			t.Errorf("Expected %s to be generated: %v", name, err)
+		} else if info.Size() == 0 {
+			t.Errorf("Expected %s to be non-empty", name)
+		}
+	}
+}
+
+func TestGenerateIndexUnchanged(t *testing.T) {
+	outputDir := t.TempDir()
+	indexPath := filepath.Join(outputDir, "index.html")
+	metadata := []*tmpl.TemplateMetadata{
+		{Name: "Build Pipeline", Identifier: "build_pipeline", Type: tmpl.TemplatePipeline},
+	}
+
+	generator := NewGenerator(nil)
+	if err := generator.GenerateIndex(metadata, outputDir); err != nil {
+		t.Fatalf("Failed to generate index: %v", err)
+	}
+
+	// An unchanged index keeps its old modification time
+	past := time.Now().Add(-time.Hour).Truncate(time.Second)
+	if err := os.Chtimes(indexPath, past, past); err != nil {
+		t.Fatalf("Failed to set index mtime: %v", err)
+	}
+	if err := generator.GenerateIndex(metadata, outputDir); err != nil {
+		t.Fatalf("Failed to regenerate index: %v", err)
+	}
+	info, err := os.Stat(indexPath)
+	if err != nil {
+		t.Fatalf("Failed to stat index: %v", err)
+	}
+	if !info.ModTime().Equal(past) {
+		t.Error("Expected unchanged index not to be rewritten")
+	}
+
+	// A changed index replaces the old one
+	metadata = append(metadata, &tmpl.TemplateMetadata{Name: "Deploy Stage", Identifier: "deploy_stage", Type: tmpl.TemplateStage})
+	if err := generator.GenerateIndex(metadata, outputDir); err != nil {
+		t.Fatalf("Failed to regenerate index: %v", err)
+	}
+	content, err := os.ReadFile(indexPath)
+	if err != nil {
+		t.Fatalf("Failed to read index: %v", err)
+	}
+	if !strings.Contains(string(content), "deploy_stage.html") {
+		t.Error("Expected changed index to be rewritten")
+	}
+
+	// No temporary files are left behind
+	entries, err := os.ReadDir(outputDir)
+	if err != nil {
+		t.Fatalf("Failed to list output directory: %v", err)
+	}
+	for _, entry := range entries {
+		if strings.HasSuffix(entry.Name(), ".tmp") {
+			t.Errorf("Expected no temporary files, found %s", entry.Name())
+		}
+	}
+}
+
+func TestIndexDataOrder(t *testing.T) {
+	metadata := []*tmpl.TemplateMetadata{
+		{Name: "Deploy", Identifier: "deploy_b", Type: tmpl.TemplateStage},
+		{Name: "Build", Identifier: "build", Type: tmpl.TemplatePipeline},
+		{Name: "Deploy", Identifier: "deploy_a", Type: tmpl.TemplateStage},
+		{Name: "Approve", Identifier: "approve", Type: tmpl.TemplateStage},
+		{Name: "Release", Identifier: "release", Type: tmpl.TemplatePipeline},
+	}
+
+	expected := map[string][]string{
+		tmpl.TemplatePipeline: {"build", "release"},
+		tmpl.TemplateStage:    {"approve", "deploy_a", "deploy_b"},
+	}
+
+	// Every delivery order must give the same groups
+	for shift := 0; shift < len(metadata); shift++ {
+		input := append(append([]*tmpl.TemplateMetadata{}, metadata[shift:]...), metadata[:shift]...)
+		data := indexData(input)
+
+		templatesByType := data["TemplatesByType"].(map[string][]*tmpl.TemplateMetadata)
+		got := make(map[string][]string, len(templatesByType))
+		for templateType, templates := range templatesByType {
+			for _, m := range templates {
+				got[templateType] = append(got[templateType], m.Identifier)
+			}
+		}
+		if !reflect.DeepEqual(got, expected) {
+			t.Errorf("Expected groups %v for input rotated by %d, got %v", expected, shift, got)
+		}
+	}
+
+	// The caller's slice is left in its original order
+	if metadata[0].Identifier != "deploy_b" {
+		t.Errorf("Expected input to be left unsorted, got %s first", metadata[0].Identifier)
+	}
+}
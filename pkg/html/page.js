@@ -0,0 +1,37 @@
+document.addEventListener('DOMContentLoaded', function() {
+    // Initialize syntax highlighting
+    hljs.highlightAll();
+
+    // Back to top functionality
+    document.getElementById('backToTop').addEventListener('click', function(e) {
+        e.preventDefault();
+        window.scrollTo({ top: 0, behavior: 'smooth' });
+    });
+
+    // Highlight active section in sidebar
+    const sections = document.querySelectorAll('.metadata-section');
+    const navLinks = document.querySelectorAll('.sidebar-nav a');
+
+    function highlightNavigation() {
+        let scrollPosition = window.scrollY + 100;
+
+        sections.forEach(section => {
+            const sectionTop = section.offsetTop;
+            const sectionHeight = section.offsetHeight;
+
+            if (scrollPosition >= sectionTop && scrollPosition < sectionTop + sectionHeight) {
+                const id = section.getAttribute('id');
+
+                navLinks.forEach(link => {
+                    link.classList.remove('active');
+                    if (link.getAttribute('href') === '#' + id) {
+                        link.classList.add('active');
+                    }
+                });
+            }
+        });
+    }
+
+    window.addEventListener('scroll', highlightNavigation);
+    highlightNavigation();
+});
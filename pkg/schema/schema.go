@@ -2,20 +2,92 @@ package schema
 
 import (
 	"encoding/json"
+	"errors"
 	"fmt"
 	"io"
+	"net"
 	"net/http"
+	"os"
+	"path/filepath"
 	"sync"
 	"time"
 
 	"github.com/sirupsen/logrus"
 )
 
+// schemaFiles maps schema types to their corresponding files
+var schemaFiles = map[string]string{
+	"pipeline":  "pipeline.json",
+	"stage":     "template.json",
+	"step":      "template.json",
+	"stepgroup": "template.json", // Stages, Steps, StepGroups are defined in template.json
+	"trigger":   "trigger.json",
+}
+
+// schemaBaseURL is where the v1 Harness schema files are fetched from
+var schemaBaseURL = "https://raw.githubusercontent.com/harness/harness-schema/main/v1/"
+
+// schemaDiskCacheTTL is how long a schema persisted to disk is used without
+// checking GitHub for a newer copy
+const schemaDiskCacheTTL = 24 * time.Hour
+
+// DefaultCacheDir returns the per-user directory the generator keeps its
+// caches in, or an empty string when the platform has no user cache
+// directory. It is private to the user, unlike the shared temp directory.
+func DefaultCacheDir() string {
+	dir, err := os.UserCacheDir()
+	if err != nil {
+		return ""
+	}
+	return filepath.Join(dir, "template-doc-gen")
+}
+
+// httpClient is shared by all schema fetches so connections are kept alive
+// and reused instead of paying a new TLS handshake per schema
+var httpClient = &http.Client{
+	Timeout: 10 * time.Second,
+}
+
+// Retry settings for transient schema fetch failures
+var (
+	schemaFetchRetries = 3
+	schemaFetchBackoff = 200 * time.Millisecond
+)
+
+// retryableStatus reports whether a response status is worth retrying
+func retryableStatus(status int) bool {
+	switch status {
+	case http.StatusTooManyRequests, http.StatusInternalServerError, http.StatusBadGateway,
+		http.StatusServiceUnavailable, http.StatusGatewayTimeout:
+		return true
+	default:
+		return false
+	}
+}
+
+// isTimeout reports whether a request failed by running out of time
+func isTimeout(err error) bool {
+	var netErr net.Error
+	return errors.As(err, &netErr) && netErr.Timeout()
+}
+
 // SchemaManager handles fetching, caching, and providing access to JSON schemas
 type SchemaManager struct {
-	logger      *logrus.Logger
-	schemaCache map[string]map[string]interface{}
-	cacheMutex  sync.RWMutex
+	logger       *logrus.Logger
+	schemaCache  map[string]map[string]interface{}
+	cacheMutex   sync.RWMutex
+	fetches      map[string]*schemaFetch
+	fetchMutex   sync.Mutex
+	diskCacheDir string
+}
+
+// schemaFetch is the outcome of loading one schema file. done is closed once
+// schema or err is set, and the outcome, failures included, is kept for the
+// rest of the run.
+type schemaFetch struct {
+	done   chan struct{}
+	schema map[string]interface{}
+	err    error
 }
 
 // NewSchemaManager creates a new schema manager
@@ -25,11 +97,19 @@ func NewSchemaManager(logger *logrus.Logger) *SchemaManager {
 		logger.SetLevel(logrus.InfoLevel)
 	}
 	return &SchemaManager{
-		logger:      logger,
-		schemaCache: make(map[string]map[string]interface{}),
+		logger:       logger,
+		schemaCache:  make(map[string]map[string]interface{}),
+		fetches:      make(map[string]*schemaFetch),
+		diskCacheDir: DefaultCacheDir(),
 	}
 }
 
+// SetDiskCacheDir sets where fetched schemas are persisted between runs.
+// An empty directory disables the disk cache.
+func (m *SchemaManager) SetDiskCacheDir(dir string) {
+	m.diskCacheDir = dir
+}
+
 // GetSchema fetches a schema from cache or from GitHub
 func (m *SchemaManager) GetSchema(schemaType string) (map[string]interface{}, error) {
 	// Convert to lowercase for consistency
@@ -44,73 +124,244 @@ func (m *SchemaManager) GetSchema(schemaType string) (map[string]interface{}, er
 		return schema, nil
 	}
 
-	// Fetch from GitHub if not in cache
-	return m.fetchSchema(schemaType)
-}
+	// Each schema file is loaded once per run. Types sharing a file share the
+	// result, and workers that miss the cache together wait for the first
+	// load instead of each starting their own. A failure is remembered too,
+	// so an unreachable GitHub costs one round of retries, not one per
+	// template. Only callers waiting on the same file are blocked.
+	schemaFile := schemaFileFor(schemaType)
 
-// fetchSchema fetches a schema from GitHub
-func (m *SchemaManager) fetchSchema(schemaType string) (map[string]interface{}, error) {
-	// Map schema types to their corresponding files
-	schemaMapping := map[string]string{
-		"pipeline":  "pipeline.json",
-		"stage":     "template.json",
-		"step":      "template.json",
-		"stepgroup": "template.json", // Stages, Steps, StepGroups are defined in template.json
-		"trigger":   "trigger.json",
+	m.fetchMutex.Lock()
+	if m.fetches == nil {
+		m.fetches = make(map[string]*schemaFetch)
 	}
+	fetch, started := m.fetches[schemaFile]
+	if !started {
+		fetch = &schemaFetch{done: make(chan struct{})}
+		m.fetches[schemaFile] = fetch
+	}
+	m.fetchMutex.Unlock()
 
-	schemaFile, ok := schemaMapping[schemaType]
+	if started {
+		<-fetch.done
+	} else {
+		fetch.schema, fetch.err = m.fetchSchema(schemaType)
+		close(fetch.done)
+	}
+	if fetch.err != nil {
+		return nil, fetch.err
+	}
+
+	m.cacheMutex.Lock()
+	m.schemaCache[schemaType] = fetch.schema
+	m.cacheMutex.Unlock()
+
+	return fetch.schema, nil
+}
+
+// schemaFileFor returns the schema file that validates a schema type
+func schemaFileFor(schemaType string) string {
+	schemaFile, ok := schemaFiles[schemaType]
 	if !ok {
 		// Default to pipeline schema if not found
 		schemaFile = "pipeline.json"
 	}
+	return schemaFile
+}
+
+// fetchSchema fetches a schema from the disk cache or from GitHub
+func (m *SchemaManager) fetchSchema(schemaType string) (map[string]interface{}, error) {
+	schemaFile := schemaFileFor(schemaType)
 
 	m.logger.Debugf("Using schema file %s for type %s", schemaFile, schemaType)
 
+	// Use a recent copy from disk before going to the network
+	body, fresh := m.readDiskCache(schemaFile)
+	if !fresh {
+		// A stale copy is revalidated with its ETag instead of downloaded again
+		etag := ""
+		if body != nil {
+			etag = m.readDiskCacheETag(schemaFile)
+		}
+
+		downloaded, newETag, err := m.downloadSchema(schemaFile, etag)
+		switch {
+		case err == nil && downloaded == nil:
+			m.logger.Debugf("Cached %s schema is unchanged upstream", schemaType)
+			m.touchDiskCache(schemaFile)
+		case err == nil:
+			body = downloaded
+			m.writeDiskCache(schemaFile, body, newETag)
+		case body != nil:
+			m.logger.Warnf("Using stale cached %s schema: %v", schemaType, err)
+		default:
+			return nil, err
+		}
+	}
+
+	// Parse JSON
+	var schema map[string]interface{}
+	if err := json.Unmarshal(body, &schema); err != nil {
+		m.logger.Errorf("Error parsing schema JSON: %v", err)
+		return nil, fmt.Errorf("error parsing schema JSON: %w", err)
+	}
+
+	// Cache the schema
+	m.cacheMutex.Lock()
+	m.schemaCache[schemaType] = schema
+	m.cacheMutex.Unlock()
+
+	m.logger.Debugf("Successfully fetched %s schema using %s", schemaType, schemaFile)
+	return schema, nil
+}
+
+// downloadSchema fetches the raw schema file and its ETag from GitHub. When
+// etag is set and the file is unchanged upstream, it returns a nil body.
+func (m *SchemaManager) downloadSchema(schemaFile string, etag string) ([]byte, string, error) {
 	// Use v1 schema URL
-	schemaURL := fmt.Sprintf("https://raw.githubusercontent.com/harness/harness-schema/main/v1/%s", schemaFile)
+	schemaURL := schemaBaseURL + schemaFile
 	m.logger.Debugf("Fetching schema from %s", schemaURL)
 
-	// Create HTTP client with timeout
-	client := &http.Client{
-		Timeout: 10 * time.Second,
+	req, err := http.NewRequest(http.MethodGet, schemaURL, nil)
+	if err != nil {
+		return nil, "", fmt.Errorf("error fetching schema: %w", err)
+	}
+	if etag != "" {
+		req.Header.Set("If-None-Match", etag)
 	}
 
-	// Make HTTP request
-	resp, err := client.Get(schemaURL)
+	// Make HTTP request, retrying transient failures with backoff. A timeout
+	// is not retried: the attempt already waited the full client timeout.
+	var resp *http.Response
+	for attempt := 0; ; attempt++ {
+		resp, err = httpClient.Do(req)
+		if attempt == schemaFetchRetries || (err == nil && !retryableStatus(resp.StatusCode)) || isTimeout(err) {
+			break
+		}
+		if err == nil {
+			resp.Body.Close()
+		}
+		time.Sleep(schemaFetchBackoff << attempt)
+	}
 	if err != nil {
 		m.logger.Errorf("Error fetching schema: %v", err)
-		return nil, fmt.Errorf("error fetching schema: %w", err)
+		return nil, "", fmt.Errorf("error fetching schema: %w", err)
 	}
 	defer resp.Body.Close()
 
 	// Check response status
+	if etag != "" && resp.StatusCode == http.StatusNotModified {
+		return nil, etag, nil
+	}
 	if resp.StatusCode != http.StatusOK {
 		m.logger.Errorf("Failed to fetch schema: %d from URL %s", resp.StatusCode, schemaURL)
-		return nil, fmt.Errorf("failed to fetch schema: %d", resp.StatusCode)
+		return nil, "", fmt.Errorf("failed to fetch schema: %d", resp.StatusCode)
 	}
 
 	// Read response body
 	body, err := io.ReadAll(resp.Body)
 	if err != nil {
 		m.logger.Errorf("Error reading schema response: %v", err)
-		return nil, fmt.Errorf("error reading schema response: %w", err)
+		return nil, "", fmt.Errorf("error reading schema response: %w", err)
 	}
 
-	// Parse JSON
-	var schema map[string]interface{}
-	if err := json.Unmarshal(body, &schema); err != nil {
-		m.logger.Errorf("Error parsing schema JSON: %v", err)
-		return nil, fmt.Errorf("error parsing schema JSON: %w", err)
+	return body, resp.Header.Get("ETag"), nil
+}
+
+// diskCachePath returns where a schema file is persisted between runs
+func (m *SchemaManager) diskCachePath(schemaFile string) string {
+	return filepath.Join(m.diskCacheDir, "harness-schema-"+schemaFile)
+}
+
+// readDiskCache returns a persisted schema file and whether it is still fresh.
+// A stale copy is still returned so it can be used when the network is down.
+func (m *SchemaManager) readDiskCache(schemaFile string) ([]byte, bool) {
+	if m.diskCacheDir == "" {
+		return nil, false
 	}
 
-	// Cache the schema
-	m.cacheMutex.Lock()
-	m.schemaCache[schemaType] = schema
-	m.cacheMutex.Unlock()
+	path := m.diskCachePath(schemaFile)
+	info, err := os.Stat(path)
+	if err != nil {
+		return nil, false
+	}
 
-	m.logger.Debugf("Successfully fetched %s schema using %s", schemaType, schemaFile)
-	return schema, nil
+	body, err := os.ReadFile(path)
+	if err != nil {
+		m.logger.Debugf("Could not read cached schema %s: %v", path, err)
+		return nil, false
+	}
+
+	fresh := time.Since(info.ModTime()) < schemaDiskCacheTTL
+	m.logger.Debugf("Found cached schema %s (fresh: %v)", path, fresh)
+	return body, fresh
+}
+
+// readDiskCacheETag returns the ETag stored next to a persisted schema file
+func (m *SchemaManager) readDiskCacheETag(schemaFile string) string {
+	etag, err := os.ReadFile(m.diskCachePath(schemaFile) + ".etag")
+	if err != nil {
+		return ""
+	}
+	return string(etag)
+}
+
+// touchDiskCache marks a persisted schema file as fresh again after GitHub
+// confirmed it is unchanged
+func (m *SchemaManager) touchDiskCache(schemaFile string) {
+	if m.diskCacheDir == "" {
+		return
+	}
+
+	now := time.Now()
+	if err := os.Chtimes(m.diskCachePath(schemaFile), now, now); err != nil {
+		m.logger.Debugf("Could not refresh cached schema %s: %v", schemaFile, err)
+	}
+}
+
+// writeDiskCache persists a schema file and its ETag atomically so
+// concurrent runs never read a partially written copy
+func (m *SchemaManager) writeDiskCache(schemaFile string, body []byte, etag string) {
+	if m.diskCacheDir == "" {
+		return
+	}
+
+	if err := os.MkdirAll(m.diskCacheDir, 0700); err != nil {
+		m.logger.Debugf("Could not create schema cache directory %s: %v", m.diskCacheDir, err)
+		return
+	}
+
+	path := m.diskCachePath(schemaFile)
+	if err := writeFileAtomic(path, body); err != nil {
+		m.logger.Debugf("Could not cache schema %s: %v", path, err)
+		return
+	}
+
+	if etag == "" {
+		os.Remove(path + ".etag")
+	} else if err := writeFileAtomic(path+".etag", []byte(etag)); err != nil {
+		m.logger.Debugf("Could not cache schema ETag %s: %v", path, err)
+	}
+}
+
+// writeFileAtomic writes data to a temporary file and renames it into place
+func writeFileAtomic(path string, data []byte) error {
+	tmp, err := os.CreateTemp(filepath.Dir(path), filepath.Base(path)+".*.tmp")
+	if err != nil {
+		return err
+	}
+
+	_, err = tmp.Write(data)
+	if closeErr := tmp.Close(); err == nil {
+		err = closeErr
+	}
+	if err == nil {
+		err = os.Rename(tmp.Name(), path)
+	}
+	if err != nil {
+		os.Remove(tmp.Name())
+	}
+	return err
 }
 
 // schemaTypeNormalize normalizes a schema type to match expected values
@@ -3,7 +3,11 @@ package schema
 import (
 	"net/http"
 	"net/http/httptest"
+	"os"
+	"sync"
+	"sync/atomic"
 	"testing"
+	"time"
 
 	"github.com/sirupsen/logrus"
 )
@@ -49,6 +53,10 @@ func TestNewSchemaManager(t *testing.T) {
 		t.Error("Expected non-nil schemaCache in SchemaManager")
 	}
 
+	if manager.diskCacheDir != DefaultCacheDir() {
+		t.Errorf("Expected disk cache in %s, got %s", DefaultCacheDir(), manager.diskCacheDir)
+	}
+
 	// Test with provided logger
 	logger := logrus.New()
 	manager = NewSchemaManager(logger)
@@ -214,6 +222,7 @@ func TestFetchSchema(t *testing.T) {
 	// Create schema manager
 	logger := logrus.New()
 	manager := NewSchemaManager(logger)
+	manager.SetDiskCacheDir(t.TempDir())
 
 	// Test fetchSchema for pipeline
 	_, err := manager.fetchSchema("pipeline")
@@ -231,6 +240,7 @@ func TestFetchSchema(t *testing.T) {
 // Test concurrent access to the schema cache
 func TestConcurrentSchemaAccess(t *testing.T) {
 	manager := NewSchemaManager(nil)
+	manager.SetDiskCacheDir(t.TempDir())
 
 	// Add a test schema to the cache directly
 	testSchema := map[string]interface{}{
@@ -277,9 +287,176 @@ func TestConcurrentSchemaAccess(t *testing.T) {
 	}
 }
 
+// Test that schemas persisted to disk are used without a network fetch
+func TestDiskCache(t *testing.T) {
+	logger := logrus.New()
+	manager := NewSchemaManager(logger)
+	manager.SetDiskCacheDir(t.TempDir())
+
+	// Persist a schema as a previous run would have
+	manager.writeDiskCache("template.json", []byte(`{"type": "object", "title": "cached"}`), "")
+
+	body, fresh := manager.readDiskCache("template.json")
+	if body == nil || !fresh {
+		t.Fatalf("Expected fresh cached schema, got fresh=%v", fresh)
+	}
+
+	// Stage and step share template.json, so both load from the same file
+	for _, schemaType := range []string{"stage", "step"} {
+		schema, err := manager.GetSchema(schemaType)
+		if err != nil {
+			t.Fatalf("Expected no error for %s, got %v", schemaType, err)
+		}
+		if schema["title"] != "cached" {
+			t.Errorf("Expected %s schema to come from disk cache, got %v", schemaType, schema)
+		}
+	}
+
+	// Disabled disk cache never returns anything
+	manager.SetDiskCacheDir("")
+	if body, _ := manager.readDiskCache("template.json"); body != nil {
+		t.Error("Expected no cached schema when disk cache is disabled")
+	}
+}
+
+// Test that a stale disk cache is revalidated with its ETag
+func TestDiskCacheRevalidation(t *testing.T) {
+	downloads := 0
+	server := httptest.NewServer(http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
+		if r.Header.Get("If-None-Match") == `"v1"` {
+			w.WriteHeader(http.StatusNotModified)
+			return
+		}
+		downloads++
+		w.Header().Set("ETag", `"v1"`)
+		w.Write([]byte(`{"type": "object", "title": "remote"}`))
+	}))
+	defer server.Close()
+
+	originalURL := schemaBaseURL
+	schemaBaseURL = server.URL + "/"
+	defer func() { schemaBaseURL = originalURL }()
+
+	cacheDir := t.TempDir()
+	manager := NewSchemaManager(logrus.New())
+	manager.SetDiskCacheDir(cacheDir)
+	if _, err := manager.GetSchema("pipeline"); err != nil {
+		t.Fatalf("Expected no error, got %v", err)
+	}
+	if etag := manager.readDiskCacheETag("pipeline.json"); etag != `"v1"` {
+		t.Fatalf("Expected ETag to be persisted, got '%s'", etag)
+	}
+
+	// Age the cached copy past its TTL
+	stale := time.Now().Add(-2 * schemaDiskCacheTTL)
+	if err := os.Chtimes(manager.diskCachePath("pipeline.json"), stale, stale); err != nil {
+		t.Fatalf("Failed to age cached schema: %v", err)
+	}
+
+	// A new run revalidates instead of downloading again
+	manager = NewSchemaManager(logrus.New())
+	manager.SetDiskCacheDir(cacheDir)
+	schema, err := manager.GetSchema("pipeline")
+	if err != nil {
+		t.Fatalf("Expected no error, got %v", err)
+	}
+	if schema["title"] != "remote" {
+		t.Errorf("Expected cached schema to be reused, got %v", schema)
+	}
+	if downloads != 1 {
+		t.Errorf("Expected 1 download, got %d", downloads)
+	}
+	if _, fresh := manager.readDiskCache("pipeline.json"); !fresh {
+		t.Error("Expected revalidated schema to be fresh again")
+	}
+}
+
+// Test that types sharing a schema file share one fetch, and that a failed
+// fetch is remembered instead of retried for every template
+func TestFetchOncePerSchemaFile(t *testing.T) {
+	var requests int32
+	failing := false
+	server := httptest.NewServer(http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
+		atomic.AddInt32(&requests, 1)
+		if failing {
+			w.WriteHeader(http.StatusServiceUnavailable)
+			return
+		}
+		w.Write([]byte(`{"type": "object"}`))
+	}))
+	defer server.Close()
+
+	originalURL, originalBackoff := schemaBaseURL, schemaFetchBackoff
+	schemaBaseURL = server.URL + "/"
+	schemaFetchBackoff = time.Millisecond
+	defer func() { schemaBaseURL, schemaFetchBackoff = originalURL, originalBackoff }()
+
+	// stage, step and stepgroup all validate against template.json
+	manager := NewSchemaManager(logrus.New())
+	manager.SetDiskCacheDir("")
+	var wg sync.WaitGroup
+	for _, schemaType := range []string{"stage", "step", "stepgroup", "stage"} {
+		wg.Add(1)
+		go func(schemaType string) {
+			defer wg.Done()
+			if _, err := manager.GetSchema(schemaType); err != nil {
+				t.Errorf("Expected no error for %s, got %v", schemaType, err)
+			}
+		}(schemaType)
+	}
+	wg.Wait()
+	if got := atomic.LoadInt32(&requests); got != 1 {
+		t.Errorf("Expected 1 request for template.json, got %d", got)
+	}
+
+	// A failure costs one round of retries for the whole run
+	failing = true
+	atomic.StoreInt32(&requests, 0)
+	manager = NewSchemaManager(logrus.New())
+	manager.SetDiskCacheDir("")
+	for _, schemaType := range []string{"stage", "step", "stage"} {
+		if _, err := manager.GetSchema(schemaType); err == nil {
+			t.Errorf("Expected error for %s while GitHub is failing", schemaType)
+		}
+	}
+	if got, want := atomic.LoadInt32(&requests), int32(schemaFetchRetries+1); got != want {
+		t.Errorf("Expected %d requests, got %d", want, got)
+	}
+}
+
+// Test that a timed out request is not retried
+func TestFetchTimeoutNotRetried(t *testing.T) {
+	var requests int32
+	release := make(chan struct{})
+	server := httptest.NewServer(http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
+		atomic.AddInt32(&requests, 1)
+		select {
+		case <-release:
+		case <-r.Context().Done():
+		}
+	}))
+	defer server.Close()
+	defer close(release)
+
+	originalURL, originalTimeout := schemaBaseURL, httpClient.Timeout
+	schemaBaseURL = server.URL + "/"
+	httpClient.Timeout = 50 * time.Millisecond
+	defer func() { schemaBaseURL, httpClient.Timeout = originalURL, originalTimeout }()
+
+	manager := NewSchemaManager(logrus.New())
+	manager.SetDiskCacheDir("")
+	if _, err := manager.GetSchema("pipeline"); err == nil {
+		t.Fatal("Expected error for a timed out fetch")
+	}
+	if got := atomic.LoadInt32(&requests); got != 1 {
+		t.Errorf("Expected 1 request, got %d", got)
+	}
+}
+
 // NewMockSchemaManager creates a schema manager with pre-populated schemas for testing
 func NewMockSchemaManager(logger *logrus.Logger) *SchemaManager {
 	manager := NewSchemaManager(logger)
+	manager.SetDiskCacheDir("")
 
 	// Pre-populate the schema cache with simplified schemas for testing
 	manager.cacheMutex.Lock()
@@ -0,0 +1,125 @@
+package template
+
+import "fmt"
+
+// extracts metadata from a template
+func (p *Processor) ExtractMetadata(templateData map[string]interface{}) (*TemplateMetadata, error) {
+	// initialize metadata
+	metadata := &TemplateMetadata{
+		Name:        "Unnamed Template",
+		Identifier:  "unnamed_template",
+		Type:        "unknown",
+		Variables:   make(map[string]Variable),
+		Parameters:  make(map[string]Parameter),
+		Description: "",
+		Tags:        []string{},
+		Author:      "Harness",
+		Version:     "1.0.0",
+		Examples:    []string{},
+		RawTemplate: templateData,
+	}
+
+	// extract template object
+	templateObj, ok := templateData["template"].(map[string]interface{})
+	if !ok {
+		return nil, fmt.Errorf("template field is not an object or missing")
+	}
+
+	// walk the template object once, dispatching on each key
+	for key, value := range templateObj {
+		switch key {
+		case "name":
+			if name, ok := value.(string); ok {
+				metadata.Name = name
+			}
+		case "identifier":
+			if identifier, ok := value.(string); ok {
+				metadata.Identifier = identifier
+			}
+		case "type":
+			if typeStr, ok := value.(string); ok {
+				metadata.Type = normalizeTemplateType(typeStr)
+			}
+		case "description":
+			if desc, ok := value.(string); ok {
+				metadata.Description = desc
+			}
+		case "author":
+			if author, ok := value.(string); ok {
+				metadata.Author = author
+			}
+		case "versionLabel":
+			switch version := value.(type) {
+			case string:
+				metadata.Version = version
+			case float64:
+				metadata.Version = fmt.Sprintf("%.1f", version)
+			}
+		case "tags":
+			// tags may also be an empty map, which leaves the list empty
+			if tags, ok := value.([]interface{}); ok {
+				metadata.Tags = make([]string, 0, len(tags))
+				for _, tag := range tags {
+					if tagStr, ok := tag.(string); ok {
+						metadata.Tags = append(metadata.Tags, tagStr)
+					}
+				}
+			}
+		case "variables":
+			if vars, ok := value.(map[string]interface{}); ok {
+				metadata.Variables = make(map[string]Variable, len(vars))
+				for name, varData := range vars {
+					if varMap, ok := varData.(map[string]interface{}); ok {
+						metadata.Variables[name] = Variable{
+							Description: getStringValue(varMap, "description", ""),
+							Type:        getStringValue(varMap, "type", "string"),
+							Required:    getBoolValue(varMap, "required", false),
+							Scope:       getStringValue(varMap, "scope", "template"),
+						}
+					}
+				}
+			}
+		case "parameters":
+			if params, ok := value.(map[string]interface{}); ok {
+				metadata.Parameters = make(map[string]Parameter, len(params))
+				for name, paramData := range params {
+					if paramMap, ok := paramData.(map[string]interface{}); ok {
+						metadata.Parameters[name] = Parameter{
+							Description: getStringValue(paramMap, "description", ""),
+							Type:        getStringValue(paramMap, "type", "string"),
+							Required:    getBoolValue(paramMap, "required", false),
+							Default:     paramMap["default"],
+							Scope:       getStringValue(paramMap, "scope", "template"),
+						}
+					}
+				}
+			}
+		case "examples":
+			if examples, ok := value.([]interface{}); ok {
+				metadata.Examples = make([]string, 0, len(examples))
+				for _, ex := range examples {
+					if exStr, ok := ex.(string); ok {
+						metadata.Examples = append(metadata.Examples, exStr)
+					}
+				}
+			}
+		}
+	}
+
+	return metadata, nil
+}
+
+// helper functions for type conversion
+func getStringValue(m map[string]interface{}, key, defaultValue string) string {
+	if val, ok := m[key].(string); ok {
+		return val
+	}
+	return defaultValue
+}
+
+func getBoolValue(m map[string]interface{}, key string, defaultValue bool) bool {
+	if val, ok := m[key].(bool); ok {
+		return val
+	}
+	return defaultValue
+}
@@ -1,11 +1,17 @@
 package template
 
 import (
+	"bytes"
+	"crypto/sha256"
+	"encoding/hex"
+	"encoding/json"
 	"fmt"
+	"io/fs"
 	"os"
 	"path/filepath"
 	"runtime"
 	"strings"
+	"sync"
 	"time"
 
 	"github.com/ka1ne/template-doc-gen/pkg/schema"
@@ -16,8 +22,24 @@ import (
 
 // processor handles template operations
 type Processor struct {
-	logger        *logrus.Logger
-	schemaManager *schema.SchemaManager
+	logger             *logrus.Logger
+	schemaManager      *schema.SchemaManager
+	concurrency        int
+	validators         map[string]compiledSchema
+	validatorsByDigest map[string]compiledSchema
+	validatorMutex     sync.RWMutex
+	resultCache        *validationCache
+	// processes one template for a worker; tests replace it to observe how
+	// many run at once
+	processFile func(templatePath string, outputDir string, outputFormat string, validateOnly bool) (*TemplateMetadata, error)
+}
+
+// compiled json schema, a digest of its source and the error from
+// compiling it, if any
+type compiledSchema struct {
+	schema *gojsonschema.Schema
+	digest string
+	err    error
 }
 
 // creates new processor
@@ -26,9 +48,13 @@ func NewProcessor(logger *logrus.Logger) *Processor {
 		logger = logrus.New()
 		logger.SetLevel(logrus.InfoLevel)
 	}
-	return &Processor{
-		logger: logger,
+	p := &Processor{
+		logger:             logger,
+		validators:         make(map[string]compiledSchema),
+		validatorsByDigest: make(map[string]compiledSchema),
 	}
+	p.processFile = p.ProcessTemplate
+	return p
 }
 
 // sets schema manager
@@ -36,25 +62,30 @@ func (p *Processor) SetSchemaManager(manager *schema.SchemaManager) {
 	p.schemaManager = manager
 }
 
+// keeps schema validation results in a file between runs, so templates
+// whose content and schema are unchanged skip the schema validator
+func (p *Processor) SetValidationCacheFile(path string) {
+	p.resultCache = loadValidationCache(path)
+}
+
+// sets number of concurrent workers, values below 1 mean one per cpu
+func (p *Processor) SetConcurrency(workers int) {
+	p.concurrency = workers
+}
+
 // processes a single template file
 func (p *Processor) ProcessTemplate(templatePath string, outputDir string, outputFormat string, validateOnly bool) (*TemplateMetadata, error) {
 	p.logger.Infof("Processing template: %s", templatePath)
 
-	// read template file
-	data, err := os.ReadFile(templatePath)
+	// read and parse template file
+	templateData, digest, err := loadTemplateData(templatePath)
 	if err != nil {
-		return nil, fmt.Errorf("error reading template file: %w", err)
-	}
-
-	// parse yaml
-	var templateData map[string]interface{}
-	if err := yaml.Unmarshal(data, &templateData); err != nil {
-		return nil, fmt.Errorf("error parsing YAML: %w", err)
+		return nil, err
 	}
 
 	// validate template
-	if valid, msg := p.ValidateTemplate(templateData); !valid {
-		p.logger.Errorf("Template validation failed for %s: %s", templatePath, msg)
+	// the caller logs the returned error, so failures are reported once
+	if valid, msg := p.validateTemplate(templateData, digest); !valid {
 		return nil, fmt.Errorf("validation failed: %s", msg)
 	}
 
@@ -75,22 +106,73 @@ func (p *Processor) ProcessTemplate(templatePath string, outputDir string, outpu
 	return metadata, nil
 }
 
+// reads a template file and parses it into a generic map, along with the
+// sha256 of its content
+// the raw bytes are handed straight to the yaml decoder, so this is the
+// single place to swap in a different parser backend
+// files that never mention a template key skip parsing and come back empty,
+// which validation then reports as a missing template key
+func loadTemplateData(templatePath string) (map[string]interface{}, string, error) {
+	data, err := os.ReadFile(templatePath)
+	if err != nil {
+		return nil, "", fmt.Errorf("error reading template file: %w", err)
+	}
+
+	sum := sha256.Sum256(data)
+	digest := hex.EncodeToString(sum[:])
+
+	if !hasTemplateKey(data) {
+		return map[string]interface{}{}, digest, nil
+	}
+
+	var templateData map[string]interface{}
+	if err := yaml.Unmarshal(data, &templateData); err != nil {
+		return nil, "", fmt.Errorf("error parsing YAML: %w", err)
+	}
+
+	return templateData, digest, nil
+}
+
+// cheaply reports whether raw yaml may hold a template before a full parse
+// the probe only looks for the key name anywhere in the file, so boms,
+// comments, directives, document markers and flow style can never make it
+// skip a real template; the parser settles the rest
+func hasTemplateKey(data []byte) bool {
+	return bytes.Contains(data, []byte("template"))
+}
+
 // processes all templates in a directory
 func (p *Processor) ProcessAllTemplates(templatesDir string, outputDir string, outputFormat string, validateOnly bool) ([]*TemplateMetadata, error) {
+	allMetadata := []*TemplateMetadata{}
+	err := p.ProcessTemplatesFunc(templatesDir, outputDir, outputFormat, validateOnly, func(metadata *TemplateMetadata) error {
+		allMetadata = append(allMetadata, metadata)
+		return nil
+	})
+	if err != nil {
+		return nil, err
+	}
+	return allMetadata, nil
+}
+
+// processes all templates in a directory, handing each successful result
+// to handle as soon as it is ready instead of waiting for the whole batch
+// handle is called from a single goroutine, so it needs no locking
+func (p *Processor) ProcessTemplatesFunc(templatesDir string, outputDir string, outputFormat string, validateOnly bool, handle func(*TemplateMetadata) error) error {
 	startTime := time.Now()
 	p.logger.Infof("Starting template processing from %s", templatesDir)
 
 	// create output directory if needed
-	if !validateOnly {
+	// an empty outputDir means the caller writes its output elsewhere
+	if !validateOnly && outputDir != "" {
 		if err := os.MkdirAll(outputDir, 0755); err != nil {
-			return nil, fmt.Errorf("error creating output directory: %w", err)
+			return fmt.Errorf("error creating output directory: %w", err)
 		}
 
 		// create type subdirectories
 		for _, templateType := range ValidTemplateTypes {
 			typeDir := filepath.Join(outputDir, templateType)
 			if err := os.MkdirAll(typeDir, 0755); err != nil {
-				return nil, fmt.Errorf("error creating type directory: %w", err)
+				return fmt.Errorf("error creating type directory: %w", err)
 			}
 		}
 	}
@@ -99,35 +181,27 @@ func (p *Processor) ProcessAllTemplates(templatesDir string, outputDir string, o
 	var templateFiles []string
 	fi, err := os.Stat(templatesDir)
 	if err != nil {
-		return nil, fmt.Errorf("error accessing template directory: %w", err)
+		return fmt.Errorf("error accessing template directory: %w", err)
 	}
 
 	if !fi.IsDir() {
 		// single file
-		if strings.HasSuffix(templatesDir, ".yaml") || strings.HasSuffix(templatesDir, ".yml") {
+		if isYAMLFile(templatesDir) {
 			templateFiles = []string{templatesDir}
 		} else {
-			return nil, fmt.Errorf("specified file is not a YAML file: %s", templatesDir)
+			return fmt.Errorf("specified file is not a YAML file: %s", templatesDir)
 		}
 	} else {
 		// find all yaml files
-		err = filepath.Walk(templatesDir, func(path string, info os.FileInfo, err error) error {
-			if err != nil {
-				return err
-			}
-			if !info.IsDir() && (strings.HasSuffix(path, ".yaml") || strings.HasSuffix(path, ".yml")) {
-				templateFiles = append(templateFiles, path)
-			}
-			return nil
-		})
+		templateFiles, err = findTemplateFiles(templatesDir)
 		if err != nil {
-			return nil, fmt.Errorf("error walking template directory: %w", err)
+			return fmt.Errorf("error walking template directory: %w", err)
 		}
 	}
 
 	if len(templateFiles) == 0 {
 		p.logger.Warning("No template files found")
-		return []*TemplateMetadata{}, nil
+		return nil
 	}
 
 	p.logger.Infof("Found %d template files", len(templateFiles))
@@ -140,7 +214,10 @@ func (p *Processor) ProcessAllTemplates(templatesDir string, outputDir string, o
 	}
 
 	// determine worker count
-	numWorkers := runtime.NumCPU()
+	numWorkers := p.concurrency
+	if numWorkers < 1 {
+		numWorkers = runtime.NumCPU()
+	}
 	if numWorkers < 1 {
 		numWorkers = 1
 	}
@@ -155,7 +232,7 @@ func (p *Processor) ProcessAllTemplates(templatesDir string, outputDir string, o
 	for w := 0; w < numWorkers; w++ {
 		go func() {
 			for filePath := range filesChan {
-				metadata, err := p.ProcessTemplate(filePath, outputDir, outputFormat, validateOnly)
+				metadata, err := p.processFile(filePath, outputDir, outputFormat, validateOnly)
 				resultChan <- result{metadata: metadata, err: err, path: filePath}
 			}
 		}()
@@ -167,18 +244,19 @@ func (p *Processor) ProcessAllTemplates(templatesDir string, outputDir string, o
 	}
 	close(filesChan)
 
-	// collect results
-	allMetadata := make([]*TemplateMetadata, 0, len(templateFiles))
+	// hand off results as they arrive
 	validCount := 0
 	errorCount := 0
 
 	for i := 0; i < len(templateFiles); i++ {
 		res := <-resultChan
+		if res.err == nil {
+			res.err = handle(res.metadata)
+		}
 		if res.err != nil {
 			p.logger.Errorf("Error processing template %s: %v", res.path, res.err)
 			errorCount++
 		} else {
-			allMetadata = append(allMetadata, res.metadata)
 			validCount++
 		}
 	}
@@ -187,13 +265,44 @@ func (p *Processor) ProcessAllTemplates(templatesDir string, outputDir string, o
 	p.logger.Infof("Processing completed in %.2f seconds", duration)
 	p.logger.Infof("Templates processed: %d successful, %d failed", validCount, errorCount)
 
-	//  note: Index generation and CSS generation would be handled by the Python service
+	if p.resultCache != nil {
+		if err := p.resultCache.save(); err != nil {
+			p.logger.Warnf("Could not save validation cache: %v", err)
+		}
+	}
+
+	return nil
+}
 
-	return allMetadata, nil
+// collects yaml files under root in a single directory walk
+// walkdir reuses the directory entry type instead of an lstat per file
+func findTemplateFiles(root string) ([]string, error) {
+	var templateFiles []string
+	err := filepath.WalkDir(root, func(path string, entry fs.DirEntry, err error) error {
+		if err != nil {
+			return err
+		}
+		if !entry.IsDir() && isYAMLFile(entry.Name()) {
+			templateFiles = append(templateFiles, path)
+		}
+		return nil
+	})
+	return templateFiles, err
+}
+
+// reports whether a file name has a yaml extension
+func isYAMLFile(name string) bool {
+	return strings.HasSuffix(name, ".yaml") || strings.HasSuffix(name, ".yml")
 }
 
 // validates a template against basic rules
 func (p *Processor) ValidateTemplate(templateData map[string]interface{}) (bool, string) {
+	return p.validateTemplate(templateData, "")
+}
+
+// validates a template, reusing cached schema results when the digest of
+// its file content is known
+func (p *Processor) validateTemplate(templateData map[string]interface{}, digest string) (bool, string) {
 	// check template key
 	templateObj, ok := templateData["template"]
 	if !ok {
@@ -207,8 +316,7 @@ func (p *Processor) ValidateTemplate(templateData map[string]interface{}) (bool,
 	}
 
 	// check required fields
-	requiredFields := []string{"name", "type"}
-	for _, field := range requiredFields {
+	for _, field := range requiredTemplateFields {
 		if _, ok := templateMap[field]; !ok {
 			return false, fmt.Sprintf("Missing required field: %s", field)
 		}
@@ -220,23 +328,14 @@ func (p *Processor) ValidateTemplate(templateData map[string]interface{}) (bool,
 		return false, "Type field is not a string"
 	}
 
-	typeValid := false
-	for _, validType := range ValidTemplateTypes {
-		if strings.EqualFold(typeStr, validType) {
-			typeValid = true
-			break
-		}
-	}
-
-	if !typeValid {
+	// the canonical type doubles as the schema lookup key
+	normalizedType := normalizeTemplateType(typeStr)
+	if _, ok := validTemplateTypeSet[normalizedType]; !ok {
 		return false, fmt.Sprintf("Invalid template type: %s. Must be one of %v", typeStr, ValidTemplateTypes)
 	}
 
 	// schema validation if available
 	if p.schemaManager != nil {
-		// normalize type for schema lookup
-		normalizedType := schema.SchemaTypeNormalize(typeStr)
-
 		// get schema
 		schemaData, err := p.schemaManager.GetSchema(normalizedType)
 		if err != nil {
@@ -245,12 +344,8 @@ func (p *Processor) ValidateTemplate(templateData map[string]interface{}) (bool,
 			return true, "Basic validation passed (schema not available)"
 		}
 
-		// prepare schema and template
-		schemaLoader := gojsonschema.NewGoLoader(schemaData)
-		documentLoader := gojsonschema.NewGoLoader(templateData)
-
-		// validate
-		result, err := gojsonschema.Validate(schemaLoader, documentLoader)
+		// validate against the compiled schema
+		schemaErrors, err := p.schemaErrors(normalizedType, schemaData, templateData, digest)
 		if err != nil {
 			p.logger.Warnf("KNOWN ISSUE: Harness schema validation error with upstream schema (https://github.com/harness/harness-schema). "+
 				"Type %s error: %v - Template is still valid according to basic validation.", typeStr, err)
@@ -258,11 +353,11 @@ func (p *Processor) ValidateTemplate(templateData map[string]interface{}) (bool,
 			return true, "Basic validation passed (with Harness schema inconsistency)"
 		}
 
-		if !result.Valid() {
+		if len(schemaErrors) > 0 {
 			// log errors but don't fail
 			p.logger.Warn("KNOWN ISSUE: Harness upstream schema validation failed - This is expected and non-critical")
 			p.logger.Warn("These errors are due to inconsistencies in the official Harness JSON schemas at https://github.com/harness/harness-schema")
-			for _, desc := range result.Errors() {
+			for _, desc := range schemaErrors {
 				p.logger.Warnf("- Schema validation detail: %s", desc)
 			}
 			return true, "Basic validation passed (with expected Harness schema inconsistencies)"
@@ -274,121 +369,75 @@ func (p *Processor) ValidateTemplate(templateData map[string]interface{}) (bool,
 	return true, "Template is valid (basic validation only)"
 }
 
-// extracts metadata from a template
-func (p *Processor) ExtractMetadata(templateData map[string]interface{}) (*TemplateMetadata, error) {
-	// initialize metadata
-	metadata := &TemplateMetadata{
-		Name:        "Unnamed Template",
-		Identifier:  "unnamed_template",
-		Type:        "unknown",
-		Variables:   make(map[string]Variable),
-		Parameters:  make(map[string]Parameter),
-		Description: "",
-		Tags:        []string{},
-		Author:      "Harness",
-		Version:     "1.0.0",
-		Examples:    []string{},
-		RawTemplate: templateData,
-	}
-
-	// extract template object
-	templateObj, ok := templateData["template"].(map[string]interface{})
-	if !ok {
-		return nil, fmt.Errorf("template field is not an object or missing")
+// returns schema validation errors for a template, served from the result
+// cache when the same content was already checked against the same schema
+func (p *Processor) schemaErrors(schemaType string, schemaData map[string]interface{}, templateData map[string]interface{}, digest string) ([]string, error) {
+	compiled, err := p.compileSchema(schemaType, schemaData)
+	if err != nil {
+		return nil, err
 	}
 
-	// extract basic fields
-	if name, ok := templateObj["name"].(string); ok {
-		metadata.Name = name
+	cacheKey := digest + ":" + schemaType
+	useCache := p.resultCache != nil && digest != "" && compiled.digest != ""
+	if useCache {
+		if errs, ok := p.resultCache.lookup(cacheKey, compiled.digest); ok {
+			return errs, nil
+		}
 	}
 
-	if identifier, ok := templateObj["identifier"].(string); ok {
-		metadata.Identifier = identifier
+	result, err := compiled.schema.Validate(gojsonschema.NewGoLoader(templateData))
+	if err != nil {
+		return nil, err
 	}
 
-	if typeStr, ok := templateObj["type"].(string); ok {
-		metadata.Type = strings.ToLower(typeStr)
+	var errs []string
+	for _, desc := range result.Errors() {
+		errs = append(errs, desc.String())
 	}
 
-	if desc, ok := templateObj["description"].(string); ok {
-		metadata.Description = desc
+	if useCache {
+		p.resultCache.store(cacheKey, compiled.digest, errs)
 	}
+	return errs, nil
+}
 
-	if author, ok := templateObj["author"].(string); ok {
-		metadata.Author = author
-	}
+// returns the compiled schema for a type, compiling it on first use
+func (p *Processor) compileSchema(schemaType string, schemaData map[string]interface{}) (compiledSchema, error) {
+	// workers hit the compiled schema on every template, so check under a
+	// read lock first and only serialize the first compile of each type
+	p.validatorMutex.RLock()
+	cached, ok := p.validators[schemaType]
+	p.validatorMutex.RUnlock()
 
-	if version, ok := templateObj["versionLabel"].(string); ok {
-		metadata.Version = version
-	} else if version, ok := templateObj["versionLabel"].(float64); ok {
-		metadata.Version = fmt.Sprintf("%.1f", version)
+	if ok {
+		return cached, cached.err
 	}
 
-	// extract tags
-	if tags, ok := templateObj["tags"].([]interface{}); ok {
-		for _, tag := range tags {
-			if tagStr, ok := tag.(string); ok {
-				metadata.Tags = append(metadata.Tags, tagStr)
-			}
-		}
-	} else if tags, ok := templateObj["tags"].(map[string]interface{}); ok && len(tags) == 0 {
-		// empty map for tags
-	}
-
-	// extract variables
-	if vars, ok := templateObj["variables"].(map[string]interface{}); ok {
-		for name, varData := range vars {
-			if varMap, ok := varData.(map[string]interface{}); ok {
-				variable := Variable{
-					Description: getStringValue(varMap, "description", ""),
-					Type:        getStringValue(varMap, "type", "string"),
-					Required:    getBoolValue(varMap, "required", false),
-					Scope:       getStringValue(varMap, "scope", "template"),
-				}
-				metadata.Variables[name] = variable
-			}
-		}
-	}
+	p.validatorMutex.Lock()
+	defer p.validatorMutex.Unlock()
 
-	// extract parameters
-	if params, ok := templateObj["parameters"].(map[string]interface{}); ok {
-		for name, paramData := range params {
-			if paramMap, ok := paramData.(map[string]interface{}); ok {
-				parameter := Parameter{
-					Description: getStringValue(paramMap, "description", ""),
-					Type:        getStringValue(paramMap, "type", "string"),
-					Required:    getBoolValue(paramMap, "required", false),
-					Default:     paramMap["default"],
-					Scope:       getStringValue(paramMap, "scope", "template"),
-				}
-				metadata.Parameters[name] = parameter
-			}
-		}
+	if cached, ok := p.validators[schemaType]; ok {
+		return cached, cached.err
 	}
 
-	// extract examples
-	if examples, ok := templateObj["examples"].([]interface{}); ok {
-		for _, ex := range examples {
-			if exStr, ok := ex.(string); ok {
-				metadata.Examples = append(metadata.Examples, exStr)
-			}
+	// json.Marshal sorts map keys, so the digest is stable for the same schema
+	// and types that share a schema file share one compiled schema
+	digest := ""
+	if source, err := json.Marshal(schemaData); err == nil {
+		sum := sha256.Sum256(source)
+		digest = hex.EncodeToString(sum[:])
+		if shared, ok := p.validatorsByDigest[digest]; ok {
+			p.validators[schemaType] = shared
+			return shared, shared.err
 		}
 	}
 
-	return metadata, nil
-}
-
-// helper functions for type conversion
-func getStringValue(m map[string]interface{}, key, defaultValue string) string {
-	if val, ok := m[key].(string); ok {
-		return val
-	}
-	return defaultValue
-}
-
-func getBoolValue(m map[string]interface{}, key string, defaultValue bool) bool {
-	if val, ok := m[key].(bool); ok {
-		return val
+	// compile errors are cached too so a broken schema is only reported once per type
+	compiled := compiledSchema{digest: digest}
+	compiled.schema, compiled.err = gojsonschema.NewSchema(gojsonschema.NewGoLoader(schemaData))
+	p.validators[schemaType] = compiled
+	if digest != "" {
+		p.validatorsByDigest[digest] = compiled
 	}
-	return defaultValue
+	return compiled, compiled.err
 }
@@ -6,11 +6,13 @@ import (
 	"os"
 	"path/filepath"
 	"strings"
+	"sync"
 	"testing"
 	"time"
 
 	"github.com/ka1ne/template-doc-gen/pkg/schema"
 	"github.com/sirupsen/logrus"
+	"github.com/xeipuuv/gojsonschema"
 )
 
 // helper to create test template file
@@ -372,6 +374,34 @@ template:
 	}
 }
 
+func TestHasTemplateKey(t *testing.T) {
+	tests := []struct {
+		name     string
+		content  string
+		expected bool
+	}{
+		{"block template", "template:\n  name: x\n", true},
+		{"template after comment", "# header\ntemplate:\n  name: x\n", true},
+		{"quoted key", "\"template\": {}\n", true},
+		{"flow mapping", "{template: {name: x}}", true},
+		{"bom before template", "\ufefftemplate:\n  name: x\n", true},
+		{"flow mapping after comment", "# header\n{template: {name: x}}", true},
+		{"flow mapping after document marker", "---\n{template: {name: x}}", true},
+		{"flow mapping on document marker line", "--- {template: {name: x}}", true},
+		{"flow mapping after directive", "%YAML 1.2\n---\n{template: {name: x}}", true},
+		{"nested template key left to the parser", "pipeline:\n  template:\n    name: x\n", true},
+		{"no template key", "name: x\ntype: Pipeline\n", false},
+	}
+
+	for _, test := range tests {
+		t.Run(test.name, func(t *testing.T) {
+			if got := hasTemplateKey([]byte(test.content)); got != test.expected {
+				t.Errorf("Expected hasTemplateKey=%v, got %v", test.expected, got)
+			}
+		})
+	}
+}
+
 func TestHelperFunctions(t *testing.T) {
 	//  test getStringValue
 	stringMap := map[string]interface{}{
@@ -412,6 +442,38 @@ func TestHelperFunctions(t *testing.T) {
 	}
 }
 
+func TestFindTemplateFiles(t *testing.T) {
+	tempDir := t.TempDir()
+	nestedDir := filepath.Join(tempDir, "nested", "deeper")
+	if err := os.MkdirAll(nestedDir, 0755); err != nil {
+		t.Fatalf("Failed to create nested directory: %v", err)
+	}
+
+	files := []string{
+		filepath.Join(tempDir, "top.yaml"),
+		filepath.Join(nestedDir, "deep.yml"),
+		filepath.Join(nestedDir, "notes.txt"),
+	}
+	for _, file := range files {
+		if err := os.WriteFile(file, []byte("template: {}"), 0644); err != nil {
+			t.Fatalf("Failed to write %s: %v", file, err)
+		}
+	}
+
+	found, err := findTemplateFiles(tempDir)
+	if err != nil {
+		t.Fatalf("findTemplateFiles failed: %v", err)
+	}
+	if len(found) != 2 {
+		t.Fatalf("Expected 2 yaml files, got %d: %v", len(found), found)
+	}
+	for _, path := range found {
+		if !isYAMLFile(path) {
+			t.Errorf("Unexpected non-yaml file: %s", path)
+		}
+	}
+}
+
 func TestProcessAllTemplates(t *testing.T) {
 	processor := NewProcessor(nil)
 
@@ -594,6 +656,87 @@ func TestConcurrentProcessing(t *testing.T) {
 	t.Logf("Processed %d templates in %v", numTemplates, duration)
 }
 
+// testConfiguredConcurrency tests that an explicit worker count is honoured
+func TestConfiguredConcurrency(t *testing.T) {
+	logger := logrus.New()
+	logger.SetOutput(io.Discard)
+	processor := NewProcessor(logger)
+	processor.SetConcurrency(2)
+
+	//  count how many templates are processed at once
+	var mutex sync.Mutex
+	running, maxRunning := 0, 0
+	processor.processFile = func(templatePath string, outputDir string, outputFormat string, validateOnly bool) (*TemplateMetadata, error) {
+		mutex.Lock()
+		running++
+		if running > maxRunning {
+			maxRunning = running
+		}
+		mutex.Unlock()
+
+		time.Sleep(20 * time.Millisecond)
+
+		mutex.Lock()
+		running--
+		mutex.Unlock()
+		return &TemplateMetadata{Name: filepath.Base(templatePath)}, nil
+	}
+
+	tempDir := t.TempDir()
+	numTemplates := 6
+	for i := 0; i < numTemplates; i++ {
+		templatePath := filepath.Join(tempDir, fmt.Sprintf("template_%d.yaml", i))
+		if err := os.WriteFile(templatePath, []byte("template: {}\n"), 0644); err != nil {
+			t.Fatalf("Failed to write template file: %v", err)
+		}
+	}
+
+	results, err := processor.ProcessAllTemplates(tempDir, "", "", true)
+	if err != nil {
+		t.Fatalf("ProcessAllTemplates failed: %v", err)
+	}
+	if len(results) != numTemplates {
+		t.Errorf("Expected %d results, got %d", numTemplates, len(results))
+	}
+	if maxRunning != 2 {
+		t.Errorf("Expected 2 templates processed at once, got %d", maxRunning)
+	}
+}
+
+// testProcessTemplatesFunc tests that results are streamed to the handler
+func TestProcessTemplatesFunc(t *testing.T) {
+	logger := logrus.New()
+	logger.SetOutput(io.Discard)
+	processor := NewProcessor(logger)
+
+	tempDir := t.TempDir()
+	for i := 0; i < 3; i++ {
+		templateContent := fmt.Sprintf(`template:
+  name: "Streamed Template %d"
+  type: "Pipeline"
+`, i)
+		templatePath := filepath.Join(tempDir, fmt.Sprintf("template_%d.yaml", i))
+		if err := os.WriteFile(templatePath, []byte(templateContent), 0644); err != nil {
+			t.Fatalf("Failed to write template file: %v", err)
+		}
+	}
+
+	handled := 0
+	err := processor.ProcessTemplatesFunc(tempDir, "", "", true, func(metadata *TemplateMetadata) error {
+		if !strings.HasPrefix(metadata.Name, "Streamed Template") {
+			t.Errorf("Unexpected template name: %s", metadata.Name)
+		}
+		handled++
+		return nil
+	})
+	if err != nil {
+		t.Fatalf("ProcessTemplatesFunc failed: %v", err)
+	}
+	if handled != 3 {
+		t.Errorf("Expected handler to be called 3 times, got %d", handled)
+	}
+}
+
 // testSchemaValidation tests that schema validation works correctly
 func TestSchemaValidation(t *testing.T) {
 	//  skip detailed schema validation tests in CI environments
@@ -608,6 +751,7 @@ func TestSchemaValidation(t *testing.T) {
 
 	//  create a real schema manager - will actually use the Harness schema repo
 	schemaManager := schema.NewSchemaManager(logger)
+	schemaManager.SetDiskCacheDir(t.TempDir())
 	processor.SetSchemaManager(schemaManager)
 
 	//  test cases - only test basic functionality, not detailed schema validation
@@ -659,3 +803,98 @@ func TestSchemaValidation(t *testing.T) {
 		})
 	}
 }
+
+func TestCompileSchemaCache(t *testing.T) {
+	processor := NewProcessor(nil)
+	schemaData := map[string]interface{}{
+		"type":     "object",
+		"required": []interface{}{"template"},
+	}
+
+	//  first call compiles the schema
+	first, err := processor.compileSchema("stage", schemaData)
+	if err != nil {
+		t.Fatalf("Failed to compile schema: %v", err)
+	}
+
+	//  second call reuses the compiled schema
+	second, err := processor.compileSchema("stage", schemaData)
+	if err != nil {
+		t.Fatalf("Failed to load compiled schema: %v", err)
+	}
+	if first.schema != second.schema {
+		t.Error("Expected compiled schema to be reused")
+	}
+	if first.digest == "" {
+		t.Error("Expected compiled schema to carry a digest")
+	}
+
+	//  types sharing a schema file share the compiled schema
+	shared, err := processor.compileSchema("step", schemaData)
+	if err != nil {
+		t.Fatalf("Failed to load shared schema: %v", err)
+	}
+	if shared.schema != first.schema {
+		t.Error("Expected identical schemas to share one compiled schema")
+	}
+
+	result, err := second.schema.Validate(gojsonschema.NewGoLoader(map[string]interface{}{}))
+	if err != nil {
+		t.Fatalf("Failed to validate document: %v", err)
+	}
+	if result.Valid() {
+		t.Error("Expected document without template key to be invalid")
+	}
+}
+
+func TestValidationCache(t *testing.T) {
+	cachePath := filepath.Join(t.TempDir(), "cache", "validation.json")
+
+	//  missing file starts empty
+	cache := loadValidationCache(cachePath)
+	if _, ok := cache.lookup("abc:stage", "schema-v1"); ok {
+		t.Fatal("Expected empty cache to miss")
+	}
+
+	cache.store("abc:stage", "schema-v1", []string{"template.spec: required"})
+	cache.store("def:pipeline", "schema-v1", nil)
+	if err := cache.save(); err != nil {
+		t.Fatalf("Failed to save validation cache: %v", err)
+	}
+
+	//  reloaded cache serves stored results for the same schema only
+	reloaded := loadValidationCache(cachePath)
+	errs, ok := reloaded.lookup("abc:stage", "schema-v1")
+	if !ok || len(errs) != 1 {
+		t.Errorf("Expected cached result with 1 error, got %v (hit: %v)", errs, ok)
+	}
+	if _, ok := reloaded.lookup("abc:stage", "schema-v2"); ok {
+		t.Error("Expected schema change to invalidate cached result")
+	}
+
+	//  entries not used in a run are kept
+	if err := reloaded.save(); err != nil {
+		t.Fatalf("Failed to save validation cache: %v", err)
+	}
+	kept := loadValidationCache(cachePath)
+	if _, ok := kept.lookup("def:pipeline", "schema-v1"); !ok {
+		t.Error("Expected entry unused in this run to be kept")
+	}
+
+	//  entries unused for longer than the max age are dropped on save
+	kept.mutex.Lock()
+	entry := kept.entries["def:pipeline"]
+	entry.Used = time.Now().Add(-validationCacheMaxAge - time.Hour).Unix()
+	kept.entries["def:pipeline"] = entry
+	kept.mutex.Unlock()
+	if err := kept.save(); err != nil {
+		t.Fatalf("Failed to save validation cache: %v", err)
+	}
+	pruned := loadValidationCache(cachePath)
+	if _, ok := pruned.lookup("def:pipeline", "schema-v1"); ok {
+		t.Error("Expected expired entry to be pruned")
+	}
+	if _, ok := pruned.lookup("abc:stage", "schema-v1"); !ok {
+		t.Error("Expected recent entry to be kept")
+	}
+}
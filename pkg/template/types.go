@@ -1,5 +1,7 @@
 package template
 
+import "strings"
+
 // metadata from a harness template
 type TemplateMetadata struct {
 	Name        string                 `json:"name" yaml:"name"`
@@ -47,3 +49,36 @@ var ValidTemplateTypes = []string{
 	TemplateStepGroup,
 	TemplateStep,
 }
+
+// lookup set of valid template types, keyed in lower case
+var validTemplateTypeSet = map[string]struct{}{
+	TemplatePipeline:  {},
+	TemplateStage:     {},
+	TemplateStepGroup: {},
+	TemplateStep:      {},
+}
+
+// fields every template must define
+var requiredTemplateFields = []string{"name", "type"}
+
+// canonical template type names keyed by the spellings seen in templates,
+// so every template of a type shares the package constant
+var canonicalTemplateTypes = map[string]string{
+	TemplatePipeline:  TemplatePipeline,
+	TemplateStage:     TemplateStage,
+	TemplateStepGroup: TemplateStepGroup,
+	TemplateStep:      TemplateStep,
+	"Pipeline":        TemplatePipeline,
+	"Stage":           TemplateStage,
+	"StepGroup":       TemplateStepGroup,
+	"Step":            TemplateStep,
+}
+
+// lower-cases a template type, returning the shared constant for known
+// spellings instead of allocating a new string
+func normalizeTemplateType(typeStr string) string {
+	if canonical, ok := canonicalTemplateTypes[typeStr]; ok {
+		return canonical
+	}
+	return strings.ToLower(typeStr)
+}
@@ -0,0 +1,128 @@
+package template
+
+import (
+	"encoding/json"
+	"os"
+	"path/filepath"
+	"sync"
+	"time"
+)
+
+// entries not used for this long are dropped when the cache is saved
+const validationCacheMaxAge = 30 * 24 * time.Hour
+
+// last-used times are only refreshed when older than this, so a run that
+// only hits the cache does not have to rewrite it
+const validationCacheTouchAge = 24 * time.Hour
+
+// remembers schema validation outcomes between runs, keyed by the sha256 of
+// the template file and its schema type
+// each entry records the digest of the schema it was checked against, so a
+// schema update invalidates it
+// keys depend only on file content, so one cache can serve any number of
+// template trees and runs over part of a tree keep the other entries
+type validationCache struct {
+	path    string
+	mutex   sync.Mutex
+	entries map[string]validationEntry
+	dirty   bool
+}
+
+// outcome of validating one template against one schema version, and when
+// it was last used
+type validationEntry struct {
+	Schema string   `json:"schema"`
+	Errors []string `json:"errors,omitempty"`
+	Used   int64    `json:"used"`
+}
+
+// loads the cache file, starting empty when it is missing or unreadable
+func loadValidationCache(path string) *validationCache {
+	cache := &validationCache{
+		path:    path,
+		entries: make(map[string]validationEntry),
+	}
+
+	data, err := os.ReadFile(path)
+	if err != nil {
+		return cache
+	}
+	if err := json.Unmarshal(data, &cache.entries); err != nil {
+		cache.entries = make(map[string]validationEntry)
+	}
+	return cache
+}
+
+// returns the cached schema errors for a template checked against the given schema
+func (c *validationCache) lookup(key string, schemaDigest string) ([]string, bool) {
+	c.mutex.Lock()
+	defer c.mutex.Unlock()
+
+	entry, ok := c.entries[key]
+	if !ok || entry.Schema != schemaDigest {
+		return nil, false
+	}
+	now := time.Now()
+	if now.Sub(time.Unix(entry.Used, 0)) > validationCacheTouchAge {
+		entry.Used = now.Unix()
+		c.entries[key] = entry
+		c.dirty = true
+	}
+	return entry.Errors, true
+}
+
+// records the schema errors for a template checked against the given schema
+func (c *validationCache) store(key string, schemaDigest string, errs []string) {
+	c.mutex.Lock()
+	defer c.mutex.Unlock()
+
+	c.entries[key] = validationEntry{Schema: schemaDigest, Errors: errs, Used: time.Now().Unix()}
+	c.dirty = true
+}
+
+// writes the cache back to disk, dropping entries unused for too long
+// the file is replaced atomically so an interrupted run never corrupts it
+func (c *validationCache) save() error {
+	c.mutex.Lock()
+	defer c.mutex.Unlock()
+
+	cutoff := time.Now().Add(-validationCacheMaxAge).Unix()
+	kept := make(map[string]validationEntry, len(c.entries))
+	for key, entry := range c.entries {
+		if entry.Used >= cutoff {
+			kept[key] = entry
+		}
+	}
+
+	if !c.dirty && len(kept) == len(c.entries) {
+		return nil
+	}
+
+	data, err := json.Marshal(kept)
+	if err != nil {
+		return err
+	}
+
+	if err := os.MkdirAll(filepath.Dir(c.path), 0700); err != nil {
+		return err
+	}
+	tmp, err := os.CreateTemp(filepath.Dir(c.path), filepath.Base(c.path)+".*.tmp")
+	if err != nil {
+		return err
+	}
+	_, err = tmp.Write(data)
+	if closeErr := tmp.Close(); err == nil {
+		err = closeErr
+	}
+	if err == nil {
+		err = os.Rename(tmp.Name(), c.path)
+	}
+	if err != nil {
+		os.Remove(tmp.Name())
+		return err
+	}
+
+	c.entries = kept
+	c.dirty = false
+	return nil
+}